@@ -0,0 +1,37 @@
+"""
+Compiled kernels for the binary diff engine.
+
+Numba is optional; when it is not installed NUMBA_AVAILABLE is False
+and the engine keeps using its NumPy implementation.
+"""
+
+from __future__ import annotations
+
+# JIT compilation - Numba
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def find_mismatches(left, right, limit):
+        """
+        Return the indices where two uint8 arrays differ.
+
+        Only the common length is scanned, and scanning stops after
+        `limit` mismatches instead of comparing the whole buffer.
+        """
+        n = min(left.size, right.size)
+        out = np.empty(min(n, limit), dtype=np.int64)
+        count = 0
+        for i in range(n):
+            if left[i] != right[i]:
+                if count == limit:
+                    break
+                out[count] = i
+                count += 1
+        return out[:count]
@@ -0,0 +1,68 @@
+"""
+Compiled kernels for the image diff engine.
+
+Numba is optional; when it is not installed NUMBA_AVAILABLE is False
+and the engine keeps using its NumPy implementation.
+"""
+
+from __future__ import annotations
+
+# JIT compilation - Numba
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Pillow's fixed-point RGB -> L weights; a pixel converts to a non-zero
+# gray level once its weighted sum reaches half of 1 << 16
+GRAY_WEIGHTS = (19595, 38470, 7471)
+GRAY_ROUNDING = 0x8000
+
+
+if NUMBA_AVAILABLE:
+    @njit(inline='always')
+    def _channel_diff(a, b, tolerance):
+        """|a - b| as an int, or 0 when it is within tolerance."""
+        d = np.int64(a) - np.int64(b)
+        if d < 0:
+            d = -d
+        return d if d > tolerance else 0
+
+    @njit(parallel=True, cache=True, nogil=True, boundscheck=False)
+    def diff_threshold_sum(left, right, tolerance, out, mask):
+        """
+        Fused absolute difference, tolerance and change mask.
+
+        Writes |left - right| per channel into out, zeroing values at
+        or below tolerance, and sets mask to 255 wherever the difference
+        pixel would convert to a non-zero gray level. Arrays are
+        (height, width, channels) uint8 with 1 or 3 channels.
+
+        Returns the sum of all difference values.
+        """
+        height, width, channels = left.shape
+        w_r, w_g, w_b = GRAY_WEIGHTS
+        total = 0
+        for y in prange(height):
+            row_total = 0
+            for x in range(width):
+                if channels == 3:
+                    r = _channel_diff(left[y, x, 0], right[y, x, 0], tolerance)
+                    g = _channel_diff(left[y, x, 1], right[y, x, 1], tolerance)
+                    b = _channel_diff(left[y, x, 2], right[y, x, 2], tolerance)
+                    out[y, x, 0] = r
+                    out[y, x, 1] = g
+                    out[y, x, 2] = b
+                    row_total += r + g + b
+                    changed = r * w_r + g * w_g + b * w_b >= GRAY_ROUNDING
+                else:
+                    d = _channel_diff(left[y, x, 0], right[y, x, 0], tolerance)
+                    out[y, x, 0] = d
+                    row_total += d
+                    changed = d > 0
+                mask[y, x] = 255 if changed else 0
+            total += row_total
+        return total
@@ -0,0 +1,151 @@
+"""
+Byte-level Myers diff.
+
+Computes a shortest edit script between two byte strings with the greedy
+O(ND) algorithm, so binary patches can describe insertions and deletions
+instead of rewriting every shifted byte.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Optional
+
+# (a_start, a_end, b_start, b_end): a[a_start:a_end] becomes b[b_start:b_end]
+Hunk = tuple[int, int, int, int]
+
+
+def diff_bytes(a: bytes, b: bytes, max_edits: int) -> Optional[list[Hunk]]:
+    """
+    Find the regions where two byte strings differ.
+
+    Args:
+        a: Original bytes
+        b: Modified bytes
+        max_edits: Give up once more single-byte insertions and deletions
+            than this are needed
+
+    Returns:
+        Ascending, non-overlapping hunks, or None if the edit distance
+        exceeds max_edits.
+    """
+    # Matching ends are the common case and are found with memcmp
+    prefix = match_length(a, 0, b, 0, min(len(a), len(b)))
+    if prefix == len(a) == len(b):
+        return []
+
+    a_rest = a[prefix:][::-1]
+    b_rest = b[prefix:][::-1]
+    suffix = match_length(a_rest, 0, b_rest, 0, min(len(a_rest), len(b_rest)))
+
+    a_mid = a[prefix:len(a) - suffix]
+    b_mid = b[prefix:len(b) - suffix]
+
+    if not a_mid or not b_mid:
+        # Pure insertion or deletion
+        hunks = [(0, len(a_mid), 0, len(b_mid))]
+    else:
+        hunks = _shortest_edit(a_mid, b_mid, max_edits)
+        if hunks is None:
+            return None
+
+    return [
+        (a_start + prefix, a_end + prefix, b_start + prefix, b_end + prefix)
+        for a_start, a_end, b_start, b_end in hunks
+    ]
+
+
+def match_length(a: bytes, x: int, b: bytes, y: int, limit: int) -> int:
+    """
+    Length of the common run starting at a[x] and b[y], at most limit.
+
+    Gallops with growing slice comparisons, each a single memcmp, then
+    bisects the window holding the first mismatch.
+    """
+    if limit <= 0 or a[x] != b[y]:
+        return 0
+
+    length = 1
+    step = 8
+    while length < limit:
+        end = min(length + step, limit)
+        if a[x + length:x + end] != b[y + length:y + end]:
+            break
+        length = end
+        step *= 2
+    else:
+        return limit
+
+    # The first mismatch lies in [length, end)
+    while end - length > 1:
+        mid = (length + end) // 2
+        if a[x + length:x + mid] == b[y + length:y + mid]:
+            length = mid
+        else:
+            end = mid
+    return length
+
+
+def _shortest_edit(a: bytes, b: bytes, max_edits: int) -> Optional[list[Hunk]]:
+    """Run the greedy Myers search and convert its path into hunks."""
+    n, m = len(a), len(b)
+    max_d = min(max_edits, n + m)
+
+    # Furthest x reached on each diagonal k, stored at v[center + k]
+    center = max_d + 1
+    v = array('q', [0]) * (2 * max_d + 3)
+    trace: list[array] = []
+
+    for d in range(max_d + 1):
+        # Snapshot of diagonals -d-1..d+1 as they were before this round
+        trace.append(v[center - d - 1:center + d + 2])
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[center + k - 1] < v[center + k + 1]):
+                x = v[center + k + 1]          # Step down: insertion
+            else:
+                x = v[center + k - 1] + 1      # Step right: deletion
+            y = x - k
+
+            if x < n and y < m:
+                x += match_length(a, x, b, y, min(n - x, m - y))
+            v[center + k] = x
+
+            if x >= n and x - k >= m:
+                return _hunks_from_trace(trace, n, m)
+
+    return None
+
+
+def _hunks_from_trace(trace: list[array], n: int, m: int) -> list[Hunk]:
+    """Walk the search snapshots back from (n, m) and merge adjacent edits."""
+    edits: list[tuple[int, int, bool]] = []  # (x, y, is_insertion)
+    x, y = n, m
+
+    for d in range(len(trace) - 1, 0, -1):
+        snapshot = trace[d]
+        k = x - y
+        # Index of diagonal k in the snapshot taken before round d
+        base = d + 1
+
+        if k == -d or (k != d and snapshot[base + k - 1] < snapshot[base + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = snapshot[base + prev_k]
+        prev_y = prev_x - prev_k
+
+        edits.append((prev_x, prev_y, x - y < prev_k))
+        x, y = prev_x, prev_y
+
+    hunks: list[list[int]] = []
+    for x, y, is_insertion in reversed(edits):
+        a_end = x if is_insertion else x + 1
+        b_end = y + 1 if is_insertion else y
+        if hunks and hunks[-1][1] == x and hunks[-1][3] == y:
+            hunks[-1][1] = a_end
+            hunks[-1][3] = b_end
+        else:
+            hunks.append([x, a_end, y, b_end])
+
+    return [tuple(hunk) for hunk in hunks]
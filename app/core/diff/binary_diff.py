@@ -11,25 +11,94 @@ Provides byte-level comparison with:
 from __future__ import annotations
 
 import os
+import mmap
+import bisect
+import stat
 import logging
+import struct
+import contextlib
+import itertools
+from array import array
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Optional, Callable, BinaryIO
+from typing import Iterator, Optional, Callable, BinaryIO, TypeVar
 
+# Vectorized byte comparison - NumPy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Parallel block hashing for equality checks - BLAKE3
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+from app.core.diff import _binary_kernels
+from app.core.diff._myers import diff_bytes
 from app.core.models import (
     BinaryDiffResult,
     BinaryDiffChunk,
     BinaryDiffType,
 )
 
+T = TypeVar('T')
+
+# Read chunk sizes are rounded up to a multiple of the page size
+READ_ALIGNMENT = 4096
+
+# Differences are grouped into display chunks of this many bytes,
+# independent of the read size
+DISPLAY_CHUNK_SIZE = 4096
+
+# Block size used when comparing memory-mapped files in quick_compare
+QUICK_COMPARE_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Block size hashed per task when quick_compare hashes files in parallel
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Maps printable ASCII to itself and everything else to '.' for hex dumps
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
+
+# Files up to this size are compared through memory maps
+MMAP_THRESHOLD = 512 * 1024 * 1024
+
+# Bytes scanned per vectorized pass over memory-mapped files
+MMAP_WINDOW_SIZE = 1024 * 1024
+
+# Mapped files at least this large are scanned on several threads
+PARALLEL_COMPARE_THRESHOLD = 16 * 1024 * 1024
+
+# Files larger than this many chunks are read ahead on a background thread
+PREFETCH_THRESHOLD_CHUNKS = 10
+
+
+def _advise_sequential(file: BinaryIO) -> None:
+    """Hint the OS that a file will be read sequentially from start to end."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = file.fileno()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        # Advice is best-effort; some filesystems reject it
+        pass
+
 
 @dataclass
 class BinaryCompareOptions:
     """Options for binary comparison."""
-    chunk_size: int = 4096
+    chunk_size: int = 256 * 1024  # Read size; rounded up to READ_ALIGNMENT
     max_differences: int = 1000  # Stop after this many differences
     context_bytes: int = 16  # Bytes of context around differences
-    align_to: int = 16  # Align output to this boundary
+    align_to: int = 16  # Align output to this boundary (display only, not reads)
     ignore_trailing_nulls: bool = False
 
 
@@ -53,6 +122,72 @@ class ByteDifference:
         return self.left_byte is not None and self.right_byte is not None
 
 
+class DifferenceBuffer(Sequence[ByteDifference]):
+    """
+    Compact storage for byte differences.
+    
+    Keeps offsets and byte values in parallel typed arrays rather than a
+    list of objects; a missing byte is stored as -1. ByteDifference
+    objects are only created when an item is accessed.
+    
+    Offsets are always in ascending order: differences are appended as
+    the files are scanned front to back, and chunk building relies on
+    this to read the first and last offsets as the range ends.
+    """
+    
+    __slots__ = ('offsets', 'left_bytes', 'right_bytes')
+    
+    def __init__(self) -> None:
+        self.offsets = array('q')
+        self.left_bytes = array('h')
+        self.right_bytes = array('h')
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = DifferenceBuffer()
+            result.offsets = self.offsets[index]
+            result.left_bytes = self.left_bytes[index]
+            result.right_bytes = self.right_bytes[index]
+            return result
+        
+        left_byte = self.left_bytes[index]
+        right_byte = self.right_bytes[index]
+        return ByteDifference(
+            self.offsets[index],
+            left_byte if left_byte >= 0 else None,
+            right_byte if right_byte >= 0 else None
+        )
+    
+    def __iter__(self) -> Iterator[ByteDifference]:
+        for offset, left_byte, right_byte in zip(
+            self.offsets, self.left_bytes, self.right_bytes
+        ):
+            yield ByteDifference(
+                offset,
+                left_byte if left_byte >= 0 else None,
+                right_byte if right_byte >= 0 else None
+            )
+    
+    def append(self, difference: ByteDifference) -> None:
+        """Append a single difference."""
+        self.offsets.append(difference.offset)
+        self.left_bytes.append(
+            -1 if difference.left_byte is None else difference.left_byte
+        )
+        self.right_bytes.append(
+            -1 if difference.right_byte is None else difference.right_byte
+        )
+    
+    def extend(self, other: DifferenceBuffer) -> None:
+        """Append all differences from another buffer."""
+        self.offsets.extend(other.offsets)
+        self.left_bytes.extend(other.left_bytes)
+        self.right_bytes.extend(other.right_bytes)
+
+
 @dataclass
 class BinaryRegion:
     """A region of bytes for display."""
@@ -94,67 +229,20 @@ class BinaryDiffEngine:
         right_path = Path(right_path)
         
         try:
-            left_exists = left_path.exists() and left_path.is_file()
-            right_exists = right_path.exists() and right_path.is_file()
-            
-            left_size = left_path.stat().st_size if left_exists else 0
-            right_size = right_path.stat().st_size if right_exists else 0
-            total_size = max(left_size, right_size)
+            left_exists, left_size = self._probe_file(left_path)
+            right_exists, right_size = self._probe_file(right_path)
             
-            differences: list[ByteDifference] = []
+            differences = DifferenceBuffer()
             chunks: list[BinaryDiffChunk] = []
             
-            # Using null context managers if files don't exist
-            import contextlib
-            
-            left_ctx = open(left_path, 'rb') if left_exists else contextlib.nullcontext()
-            right_ctx = open(right_path, 'rb') if right_exists else contextlib.nullcontext()
-            
-            with left_ctx as left_file, right_ctx as right_file:
-                offset = 0
-                bytes_processed = 0
-                
-                while True:
-                    left_chunk = left_file.read(self.options.chunk_size) if left_exists else b''
-                    right_chunk = right_file.read(self.options.chunk_size) if right_exists else b''
-                    
-                    if not left_chunk and not right_chunk:
-                        if offset == 0 and (left_exists or right_exists):
-                            # Special case: at least one file exists but is empty
-                            # Or we just finished reading
-                            pass
-                        
-                        if offset >= total_size:
-                            break
-                    
-                    # Compare chunks
-                    chunk_diffs = self._compare_chunks(
-                        left_chunk, right_chunk, offset
-                    )
-                    
-                    if chunk_diffs:
-                        differences.extend(chunk_diffs)
-                        
-                        # Create display chunk
-                        chunk = self._create_diff_chunk(
-                            left_chunk, right_chunk, offset, chunk_diffs
-                        )
-                        chunks.append(chunk)
-                    
-                    chunk_len = max(len(left_chunk), len(right_chunk))
-                    offset += chunk_len
-                    bytes_processed = offset
-                    
-                    if progress_callback:
-                        progress_callback(bytes_processed, total_size)
-                    
-                    # If both are empty/EOF, break
-                    if not left_chunk and not right_chunk:
-                        break
-
-                    # Check limit
-                    if len(differences) >= self.options.max_differences:
-                        break
+            for chunk_diffs, chunk in self._iter_diff_chunks(
+                left_path if left_exists else None,
+                right_path if right_exists else None,
+                max(left_size, right_size),
+                progress_callback
+            ):
+                differences.extend(chunk_diffs)
+                chunks.append(chunk)
             
             is_identical = len(differences) == 0 and left_size == right_size and (left_exists == right_exists)
             
@@ -172,6 +260,41 @@ class BinaryDiffEngine:
         except (PermissionError, OSError) as e:
             logging.error(f"BinaryDiffEngine - Error comparing files {left_path} and {right_path}: {e}")
             raise
+    
+    def iter_compare(
+        self,
+        left_path: Path | str,
+        right_path: Path | str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[tuple[DifferenceBuffer, BinaryDiffChunk]]:
+        """
+        Compare two binary files, yielding results as they are found.
+        
+        Yields (differences, display chunk) for every chunk that differs,
+        so callers can page through large files without holding the whole
+        result in memory. Stops after max_differences, like compare().
+        
+        Args:
+            left_path: Path to left file
+            right_path: Path to right file
+            progress_callback: Called with (bytes_processed, total_bytes)
+        """
+        left_path = Path(left_path)
+        right_path = Path(right_path)
+        
+        try:
+            left_exists, left_size = self._probe_file(left_path)
+            right_exists, right_size = self._probe_file(right_path)
+            
+            yield from self._iter_diff_chunks(
+                left_path if left_exists else None,
+                right_path if right_exists else None,
+                max(left_size, right_size),
+                progress_callback
+            )
+        except (PermissionError, OSError) as e:
+            logging.error(f"BinaryDiffEngine - Error comparing files {left_path} and {right_path}: {e}")
+            raise
 
     def quick_compare(
         self,
@@ -188,8 +311,8 @@ class BinaryDiffEngine:
         right_path = Path(right_path)
         
         try:
-            left_exists = left_path.exists() and left_path.is_file()
-            right_exists = right_path.exists() and right_path.is_file()
+            left_exists, left_size = self._probe_file(left_path)
+            right_exists, right_size = self._probe_file(right_path)
             
             if not left_exists or not right_exists:
                 if not left_exists and not right_exists:
@@ -197,56 +320,413 @@ class BinaryDiffEngine:
                 return False, 0
 
             # Size check
-            left_size = left_path.stat().st_size
-            right_size = right_path.stat().st_size
-            
             if left_size != right_size:
                 return False, 0
             
-            # Byte-by-byte comparison
-            with open(left_path, 'rb') as lf, open(right_path, 'rb') as rf:
-                offset = 0
-                while True:
-                    left_chunk = lf.read(self.options.chunk_size)
-                    right_chunk = rf.read(self.options.chunk_size)
-                    
-                    if left_chunk != right_chunk:
-                        # Find exact offset
-                        for i, (lb, rb) in enumerate(zip(left_chunk, right_chunk)):
-                            if lb != rb:
-                                return False, offset + i
-                        # Different lengths
-                        return False, offset + min(len(left_chunk), len(right_chunk))
-                    
-                    if not left_chunk:
-                        break
-                    
-                    offset += len(left_chunk)
+            if left_size == 0:
+                return True, None
+            
+            # Compare the mapped files block by block; each block equality
+            # is a single memcmp over the page cache
+            with open(left_path, 'rb') as lf, open(right_path, 'rb') as rf, \
+                    mmap.mmap(lf.fileno(), 0, access=mmap.ACCESS_READ) as lm, \
+                    mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ) as rm:
+                for file, mapped in ((lf, lm), (rf, rm)):
+                    _advise_sequential(file)
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                size = min(len(lm), len(rm))
+                if self._use_block_hashing(size):
+                    mismatch = self._first_mismatched_block(lm, rm, size)
+                    blocks = () if mismatch is None else (mismatch,)
+                    block_size = HASH_BLOCK_SIZE
+                else:
+                    blocks = range(0, size, QUICK_COMPARE_BLOCK_SIZE)
+                    block_size = QUICK_COMPARE_BLOCK_SIZE
+                for offset in blocks:
+                    end = min(offset + block_size, size)
+                    left_block = lm[offset:end]
+                    right_block = rm[offset:end]
+                    if left_block != right_block:
+                        return False, offset + self._first_mismatch(
+                            left_block, right_block
+                        )
+                
+                if len(lm) != len(rm):
+                    return False, size
         except (PermissionError, OSError) as e:
             logging.error(f"BinaryDiffEngine - Error in quick compare for {left_path} and {right_path}: {e}")
             raise
         
         return True, None
     
+    @staticmethod
+    def _use_block_hashing(size: int) -> bool:
+        """Whether quick_compare should hash blocks on several threads."""
+        return (
+            BLAKE3_AVAILABLE
+            and size >= PARALLEL_COMPARE_THRESHOLD
+            and (os.cpu_count() or 1) > 1
+        )
+    
+    @classmethod
+    def _first_mismatched_block(
+        cls,
+        left: mmap.mmap,
+        right: mmap.mmap,
+        size: int
+    ) -> Optional[int]:
+        """
+        Offset of the first HASH_BLOCK_SIZE block whose digests differ.
+        
+        BLAKE3 releases the GIL while hashing, so blocks of both files
+        are hashed concurrently and the digests compared in file order.
+        Returns None when every block matches.
+        """
+        with memoryview(left) as left_view, memoryview(right) as right_view:
+            def hash_block(offset: int) -> bool:
+                end = min(offset + HASH_BLOCK_SIZE, size)
+                return (
+                    blake3.blake3(left_view[offset:end]).digest()
+                    == blake3.blake3(right_view[offset:end]).digest()
+                )
+            
+            offsets = range(0, size, HASH_BLOCK_SIZE)
+            with contextlib.closing(cls._map_parallel(hash_block, offsets)) as matches:
+                for offset, matched in zip(offsets, matches):
+                    if not matched:
+                        return offset
+        return None
+    
+    @staticmethod
+    def _probe_file(path: Path) -> tuple[bool, int]:
+        """
+        Return (is_regular_file, size), with size 0 for missing files.
+        
+        A single stat() answers both questions, so the file cannot change
+        between the existence check and the size lookup.
+        """
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False, 0
+        if not stat.S_ISREG(st.st_mode):
+            return False, 0
+        return True, st.st_size
+    
+    def _iter_diff_chunks(
+        self,
+        left_path: Optional[Path],
+        right_path: Optional[Path],
+        total_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[tuple[DifferenceBuffer, BinaryDiffChunk]]:
+        """
+        Open both files and yield (differences, display chunk) pairs.
+        
+        A None path stands for a missing file, which reads as empty.
+        """
+        # Whole pages per read, matching readahead and direct I/O alignment
+        chunk_size = -(-max(1, self.options.chunk_size) // READ_ALIGNMENT) * READ_ALIGNMENT
+        
+        with contextlib.ExitStack() as stack:
+            # Unbuffered: chunks are read straight into reused buffers
+            left_file = stack.enter_context(open(left_path, 'rb', buffering=0)) if left_path else None
+            right_file = stack.enter_context(open(right_path, 'rb', buffering=0)) if right_path else None
+            
+            for file in (left_file, right_file):
+                if file is not None:
+                    _advise_sequential(file)
+            
+            if NUMPY_AVAILABLE and 0 < total_size <= MMAP_THRESHOLD:
+                # Files that fit comfortably in memory are mapped and scanned
+                # in large vectorized windows instead of chunk by chunk
+                yield from self._iter_mapped_diffs(
+                    left_file, right_file, total_size, chunk_size, progress_callback
+                )
+            else:
+                yield from self._iter_streamed_diffs(
+                    left_file, right_file, total_size, chunk_size, progress_callback
+                )
+    
+    def _iter_streamed_diffs(
+        self,
+        left_file: Optional[BinaryIO],
+        right_file: Optional[BinaryIO],
+        total_size: int,
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[tuple[DifferenceBuffer, BinaryDiffChunk]]:
+        """Compare two open files chunk by chunk."""
+        # Overlap reads with comparison once the files span many chunks
+        prefetch = total_size > PREFETCH_THRESHOLD_CHUNKS * chunk_size
+        max_differences = self.options.max_differences
+        found = 0
+        offset = 0
+        
+        with contextlib.closing(self._iter_chunk_pairs(
+            left_file, right_file, chunk_size, prefetch
+        )) as chunk_pairs:
+            for left_chunk, right_chunk in chunk_pairs:
+                # Compare chunks, stopping at the remaining budget
+                chunk_diffs = self._compare_chunks(
+                    left_chunk, right_chunk, offset,
+                    limit=max_differences - found
+                )
+                
+                if chunk_diffs:
+                    found += len(chunk_diffs)
+                    
+                    # Create display chunks
+                    yield from self._iter_display_chunks(
+                        left_chunk, right_chunk, offset, chunk_diffs
+                    )
+                
+                offset += max(len(left_chunk), len(right_chunk))
+                
+                if progress_callback:
+                    progress_callback(offset, total_size)
+                
+                # Check limit
+                if found >= max_differences:
+                    break
+    
+    def _iter_mapped_diffs(
+        self,
+        left_file: Optional[BinaryIO],
+        right_file: Optional[BinaryIO],
+        total_size: int,
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[tuple[DifferenceBuffer, BinaryDiffChunk]]:
+        """
+        Compare two files through read-only memory maps.
+        
+        Each window of many chunks is scanned in one vectorized pass over
+        zero-copy views of the mappings. Display chunks and the
+        max_differences cut-off are the same as in the streamed comparison.
+        """
+        window_size = max(1, MMAP_WINDOW_SIZE // chunk_size) * chunk_size
+        ignore_trailing_nulls = self.options.ignore_trailing_nulls
+        max_differences = self.options.max_differences
+        found = 0
+        
+        with contextlib.ExitStack() as stack:
+            left_map = self._map_file(left_file, stack)
+            right_map = self._map_file(right_file, stack)
+            # Registered last so the views are released before the maps close
+            left_view = stack.enter_context(memoryview(left_map))
+            right_view = stack.enter_context(memoryview(right_map))
+            
+            def scan_window(window_start: int) -> DifferenceBuffer:
+                # Windows scanned ahead only need what is left of the budget
+                # when they start; the consumer trims any excess
+                remaining = max_differences - found
+                if remaining <= 0:
+                    return DifferenceBuffer()
+                window_end = window_start + window_size
+                return self._find_differences(
+                    left_view[window_start:window_end],
+                    right_view[window_start:window_end],
+                    window_start,
+                    ignore_trailing_nulls=ignore_trailing_nulls,
+                    limit=remaining
+                )
+            
+            # No further windows are submitted once the limit is reached
+            window_starts = itertools.takewhile(
+                lambda _: found < max_differences,
+                range(0, total_size, window_size)
+            )
+            if total_size >= PARALLEL_COMPARE_THRESHOLD:
+                # NumPy releases the GIL while comparing, so windows scan in
+                # parallel; closed before the views so no scan outlives them
+                window_results = stack.enter_context(contextlib.closing(
+                    self._map_parallel(scan_window, window_starts)
+                ))
+            else:
+                window_results = map(scan_window, window_starts)
+            
+            for window_start, window_diffs in zip(range(0, total_size, window_size), window_results):
+                window_end = window_start + window_size
+                
+                window_diffs = window_diffs[:max_differences - found]
+                if window_diffs:
+                    found += len(window_diffs)
+                    yield from self._iter_display_chunks(
+                        left_view[window_start:window_end],
+                        right_view[window_start:window_end],
+                        window_start,
+                        window_diffs
+                    )
+                
+                if progress_callback:
+                    progress_callback(min(window_end, total_size), total_size)
+                
+                if found >= max_differences:
+                    return
+    
+    @staticmethod
+    def _map_parallel(
+        func: Callable[[int], T],
+        items: Iterable[int],
+        max_workers: Optional[int] = None
+    ) -> Iterator[T]:
+        """
+        Ordered map() over a thread pool with bounded look-ahead.
+        
+        Closing the iterator early cancels work that has not started yet
+        and waits for work already running.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        items = iter(items)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(func, item)
+                for item in itertools.islice(items, max_workers * 2)
+            )
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    for item in itertools.islice(items, 1):
+                        pending.append(executor.submit(func, item))
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def _map_file(
+        file: Optional[BinaryIO],
+        stack: contextlib.ExitStack
+    ) -> mmap.mmap | bytes:
+        """Map a file read-only; missing or empty files map to b''."""
+        if file is None:
+            return b''
+        try:
+            return stack.enter_context(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        except ValueError:
+            # Empty files cannot be mapped
+            return b''
+    
+    @classmethod
+    def _iter_chunk_pairs(
+        cls,
+        left_file: Optional[BinaryIO],
+        right_file: Optional[BinaryIO],
+        chunk_size: int,
+        prefetch: bool = False
+    ) -> Iterator[tuple[bytes | bytearray | memoryview, bytes | bytearray | memoryview]]:
+        """
+        Yield (left_chunk, right_chunk) pairs until both files are exhausted.
+        
+        Chunks are read into reused buffers, so a pair is only valid until
+        the next one is requested. A missing file reads as empty. With
+        prefetch enabled the next pair is read on a background thread into
+        a second set of buffers while the caller processes the current one,
+        so disk latency overlaps the comparison.
+        """
+        buffers = [
+            (bytearray(chunk_size), bytearray(chunk_size))
+            for _ in range(2 if prefetch else 1)
+        ]
+        
+        def read_pair(index: int):
+            left_buffer, right_buffer = buffers[index]
+            return (
+                cls._read_chunk(left_file, left_buffer),
+                cls._read_chunk(right_file, right_buffer)
+            )
+        
+        if not prefetch:
+            while True:
+                pair = read_pair(0)
+                if not pair[0] and not pair[1]:
+                    return
+                yield pair
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            index = 0
+            pending = executor.submit(read_pair, index)
+            while True:
+                pair = pending.result()
+                if not pair[0] and not pair[1]:
+                    return
+                index ^= 1
+                pending = executor.submit(read_pair, index)
+                yield pair
+    
+    @staticmethod
+    def _read_chunk(
+        file: Optional[BinaryIO],
+        buffer: bytearray
+    ) -> bytes | bytearray | memoryview:
+        """
+        Fill buffer from file, returning the filled part.
+        
+        A full buffer is returned as is, so equality checks on it stay a
+        plain memcmp; a short final read is returned as a view.
+        """
+        if file is None:
+            return b''
+        
+        view = memoryview(buffer)
+        filled = 0
+        while filled < len(buffer):
+            count = file.readinto(view[filled:])
+            if not count:
+                break
+            filled += count
+        
+        return buffer if filled == len(buffer) else view[:filled]
+    
+    @staticmethod
+    def _first_mismatch(left: bytes, right: bytes) -> int:
+        """
+        Locate the first differing byte of two equal-length buffers.
+        
+        Halves the search window with memcmp comparisons and only scans
+        the final few bytes in Python.
+        """
+        lo, hi = 0, min(len(left), len(right))
+        while hi - lo > 64:
+            mid = (lo + hi) // 2
+            if left[lo:mid] == right[lo:mid]:
+                lo = mid
+            else:
+                hi = mid
+        
+        for i in range(lo, hi):
+            if left[i] != right[i]:
+                return i
+        return hi
+    
     def compare_bytes(
         self,
         left_data: bytes,
         right_data: bytes
     ) -> BinaryDiffResult:
         """Compare two byte sequences directly."""
-        differences: list[ByteDifference] = []
-        
-        max_len = max(len(left_data), len(right_data))
+        if left_data == right_data:
+            return BinaryDiffResult(
+                left_path="<bytes>",
+                right_path="<bytes>",
+                left_size=len(left_data),
+                right_size=len(right_data),
+                is_identical=True,
+                differences=DifferenceBuffer(),
+                chunks=[],
+                total_differences=0
+            )
         
-        for i in range(max_len):
-            left_byte = left_data[i] if i < len(left_data) else None
-            right_byte = right_data[i] if i < len(right_data) else None
-            
-            if left_byte != right_byte:
-                differences.append(ByteDifference(i, left_byte, right_byte))
-                
-                if len(differences) >= self.options.max_differences:
-                    break
+        differences = self._find_differences(
+            left_data, right_data, 0,
+            ignore_trailing_nulls=False,
+            limit=self.options.max_differences
+        )
         
         chunks = self._build_chunks_from_differences(
             left_data, right_data, differences
@@ -276,34 +756,25 @@ class BinaryDiffEngine:
         Yields lines in the format:
         OFFSET: XX XX XX XX ... | ASCII...
         """
+        view = memoryview(data)
+        ascii_text = bytes(data).translate(_ASCII_TABLE).decode('ascii')
+        
         for i in range(0, len(data), bytes_per_line):
-            chunk = data[i:i + bytes_per_line]
-            
-            # Offset
-            line = f"{offset + i:08X}: "
+            chunk = view[i:i + bytes_per_line]
             
-            # Hex bytes
-            hex_parts = []
-            for j, byte in enumerate(chunk):
-                hex_parts.append(f"{byte:02X}")
-                if j == 7:  # Extra space in middle
-                    hex_parts.append("")
+            # Hex bytes, with an extra space after the eighth byte
+            hex_str = chunk.hex(' ').upper()
+            gap = 1 if len(chunk) > 7 else 0
+            if gap:
+                hex_str = hex_str[:23] + " " + hex_str[23:]
             
             # Pad if necessary
-            while len(hex_parts) < bytes_per_line + 1:
-                hex_parts.append("  ")
+            padding = "   " * (bytes_per_line + 1 - len(chunk) - gap)
             
-            line += " ".join(hex_parts)
-            
-            # ASCII representation
-            line += " | "
-            for byte in chunk:
-                if 32 <= byte < 127:
-                    line += chr(byte)
-                else:
-                    line += "."
-            
-            yield line
+            yield (
+                f"{offset + i:08X}: {hex_str}{padding} | "
+                + ascii_text[i:i + bytes_per_line]
+            )
     
     def hex_dump_comparison(
         self,
@@ -315,24 +786,37 @@ class BinaryDiffEngine:
         
         Yields tuples of (left_line, right_line, diff_positions)
         """
-        left_data = chunk.left_bytes
-        right_data = chunk.right_bytes
+        # Slice zero-copy views and translate the ASCII columns only once
+        left_data = memoryview(chunk.left_bytes)
+        right_data = memoryview(chunk.right_bytes)
+        left_ascii = chunk.left_bytes.translate(_ASCII_TABLE).decode('ascii')
+        right_ascii = chunk.right_bytes.translate(_ASCII_TABLE).decode('ascii')
         max_len = max(len(left_data), len(right_data))
         
         for i in range(0, max_len, bytes_per_line):
-            left_chunk = left_data[i:i + bytes_per_line] if i < len(left_data) else b''
-            right_chunk = right_data[i:i + bytes_per_line] if i < len(right_data) else b''
+            left_chunk = left_data[i:i + bytes_per_line]
+            right_chunk = right_data[i:i + bytes_per_line]
             
-            # Find differences in this line
-            diff_positions = []
-            for j in range(bytes_per_line):
-                left_byte = left_chunk[j] if j < len(left_chunk) else None
-                right_byte = right_chunk[j] if j < len(right_chunk) else None
-                if left_byte != right_byte:
-                    diff_positions.append(j)
+            # Find differences in this line; bytes present on one side only
+            # always differ
+            common = min(len(left_chunk), len(right_chunk))
+            diff_positions = [
+                j for j, (left_byte, right_byte)
+                in enumerate(zip(left_chunk, right_chunk))
+                if left_byte != right_byte
+            ]
+            diff_positions.extend(
+                range(common, max(len(left_chunk), len(right_chunk)))
+            )
             
-            left_line = self._format_hex_line(left_chunk, chunk.offset + i, bytes_per_line)
-            right_line = self._format_hex_line(right_chunk, chunk.offset + i, bytes_per_line)
+            left_line = self._format_hex_line(
+                left_chunk, chunk.offset + i, bytes_per_line,
+                left_ascii[i:i + bytes_per_line]
+            )
+            right_line = self._format_hex_line(
+                right_chunk, chunk.offset + i, bytes_per_line,
+                right_ascii[i:i + bytes_per_line]
+            )
             
             yield (left_line, right_line, diff_positions)
     
@@ -340,27 +824,161 @@ class BinaryDiffEngine:
         self,
         left: bytes,
         right: bytes,
-        offset: int
-    ) -> list[ByteDifference]:
-        """Compare two chunks and return differences."""
-        differences = []
-        
-        max_len = max(len(left), len(right))
-        
-        for i in range(max_len):
-            left_byte = left[i] if i < len(left) else None
-            right_byte = right[i] if i < len(right) else None
-            
-            if left_byte != right_byte:
-                # Handle trailing nulls option
-                if self.options.ignore_trailing_nulls:
-                    if (left_byte == 0 and right_byte is None) or \
-                       (right_byte == 0 and left_byte is None):
-                        continue
-                
-                differences.append(ByteDifference(
-                    offset + i, left_byte, right_byte
-                ))
+        offset: int,
+        limit: Optional[int] = None
+    ) -> DifferenceBuffer:
+        """Compare two chunks and return at most limit differences."""
+        # Most chunks of similar files match; a memcmp settles them outright
+        if left == right:
+            return DifferenceBuffer()
+        
+        return self._find_differences(
+            left, right, offset,
+            ignore_trailing_nulls=self.options.ignore_trailing_nulls,
+            limit=limit
+        )
+    
+    def _iter_display_chunks(
+        self,
+        left: bytes,
+        right: bytes,
+        offset: int,
+        differences: DifferenceBuffer
+    ) -> Iterator[tuple[DifferenceBuffer, BinaryDiffChunk]]:
+        """
+        Split differences found in a read into display chunks.
+        
+        Chunks cover DISPLAY_CHUNK_SIZE-aligned regions of the file, so
+        far-apart differences in one large read are shown separately.
+        
+        Args:
+            left: Left bytes starting at offset
+            right: Right bytes starting at offset
+            offset: Absolute offset of the buffers' first byte
+            differences: Differences within the buffers, in offset order
+        """
+        offsets = differences.offsets
+        start = 0
+        while start < len(offsets):
+            chunk_start = offsets[start] // DISPLAY_CHUNK_SIZE * DISPLAY_CHUNK_SIZE
+            chunk_end = chunk_start + DISPLAY_CHUNK_SIZE
+            end = bisect.bisect_left(offsets, chunk_end, start)
+            
+            chunk_diffs = differences[start:end]
+            rel_start = chunk_start - offset
+            yield chunk_diffs, self._create_diff_chunk(
+                left[rel_start:rel_start + DISPLAY_CHUNK_SIZE],
+                right[rel_start:rel_start + DISPLAY_CHUNK_SIZE],
+                chunk_start,
+                chunk_diffs
+            )
+            start = end
+    
+    def _find_differences(
+        self,
+        left: bytes,
+        right: bytes,
+        offset: int,
+        ignore_trailing_nulls: bool,
+        limit: Optional[int] = None
+    ) -> DifferenceBuffer:
+        """
+        Find differing bytes between two buffers.
+        
+        Uses a vectorized NumPy scan when available, writing the
+        mismatching positions straight into the buffer's typed arrays.
+        
+        Args:
+            left: Left buffer
+            right: Right buffer
+            offset: Absolute offset of the buffers' first byte
+            ignore_trailing_nulls: Skip null bytes present on one side only
+            limit: Maximum number of differences to return
+        """
+        if not NUMPY_AVAILABLE:
+            return self._find_differences_python(
+                left, right, offset, ignore_trailing_nulls, limit
+            )
+        
+        la = np.frombuffer(left, dtype=np.uint8)
+        ra = np.frombuffer(right, dtype=np.uint8)
+        common = min(la.size, ra.size)
+        
+        if _binary_kernels.NUMBA_AVAILABLE:
+            # Compiled scan that stops as soon as the limit is reached
+            diff_idx = _binary_kernels.find_mismatches(
+                la, ra, common if limit is None else limit
+            )
+        else:
+            diff_idx = np.flatnonzero(la[:common] != ra[:common])
+            if limit is not None:
+                diff_idx = diff_idx[:limit]
+        
+        differences = DifferenceBuffer()
+        
+        # Bytes past the end of the shorter buffer exist on one side only
+        tail_is_left = la.size > common
+        tail = la[common:] if tail_is_left else ra[common:]
+        tail_idx = np.arange(common, common + tail.size)
+        if ignore_trailing_nulls:
+            tail_idx = tail_idx[tail != 0]
+        if limit is not None:
+            tail_idx = tail_idx[:max(0, limit - diff_idx.size)]
+        
+        tail_values = tail[tail_idx - common].astype(np.int16)
+        missing = np.full(tail_idx.size, -1, dtype=np.int16)
+        
+        offsets = np.concatenate((diff_idx, tail_idx)) + offset
+        left_values = np.concatenate((
+            la[diff_idx].astype(np.int16),
+            tail_values if tail_is_left else missing
+        ))
+        right_values = np.concatenate((
+            ra[diff_idx].astype(np.int16),
+            missing if tail_is_left else tail_values
+        ))
+        
+        differences.offsets.frombytes(offsets.astype(np.int64).tobytes())
+        differences.left_bytes.frombytes(left_values.tobytes())
+        differences.right_bytes.frombytes(right_values.tobytes())
+        
+        return differences
+    
+    def _find_differences_python(
+        self,
+        left: bytes,
+        right: bytes,
+        offset: int,
+        ignore_trailing_nulls: bool,
+        limit: Optional[int] = None
+    ) -> DifferenceBuffer:
+        """Pure Python fallback for _find_differences."""
+        differences = DifferenceBuffer()
+        common = min(len(left), len(right))
+        
+        diff_idx = list(itertools.islice(
+            (i for i in range(common) if left[i] != right[i]), limit
+        ))
+        
+        # Bytes past the end of the shorter buffer exist on one side only
+        tail_is_left = len(left) > common
+        tail = left[common:] if tail_is_left else right[common:]
+        tail_idx: Iterable[int] = range(common, common + len(tail))
+        if ignore_trailing_nulls:
+            # Null bytes are falsy, so compress() drops them without a branch
+            tail_idx = itertools.compress(tail_idx, tail)
+        if limit is not None:
+            tail_idx = itertools.islice(tail_idx, max(0, limit - len(diff_idx)))
+        tail_idx = list(tail_idx)
+        
+        tail_values = [tail[i - common] for i in tail_idx]
+        missing = [-1] * len(tail_idx)
+        
+        differences.offsets.extend(offset + i for i in diff_idx + tail_idx)
+        differences.left_bytes.extend(left[i] for i in diff_idx)
+        differences.left_bytes.extend(tail_values if tail_is_left else missing)
+        differences.right_bytes.extend(right[i] for i in diff_idx)
+        differences.right_bytes.extend(missing if tail_is_left else tail_values)
         
         return differences
     
@@ -369,7 +987,7 @@ class BinaryDiffEngine:
         left: bytes,
         right: bytes,
         offset: int,
-        differences: list[ByteDifference]
+        differences: DifferenceBuffer
     ) -> BinaryDiffChunk:
         """Create a display chunk for a region with differences."""
         # Determine chunk type
@@ -381,20 +999,25 @@ class BinaryDiffEngine:
             diff_type = BinaryDiffType.MODIFIED
         
         # Calculate display range with context
-        if differences:
-            min_offset = min(d.offset for d in differences)
-            max_offset = max(d.offset for d in differences)
+        diff_offsets = differences.offsets
+        if diff_offsets:
+            # Offsets are ascending, so the extremes are the ends
+            min_offset = diff_offsets[0]
+            max_offset = diff_offsets[-1]
             
             # Align to boundary
-            start = (min_offset // self.options.align_to) * self.options.align_to
-            end = ((max_offset // self.options.align_to) + 1) * self.options.align_to
+            align_to = self.options.align_to
+            context_bytes = self.options.context_bytes
+            
+            start = (min_offset // align_to) * align_to
+            end = ((max_offset // align_to) + 1) * align_to
             
             # Add context
-            start = max(offset, start - self.options.context_bytes)
-            end = min(offset + max(len(left), len(right)), end + self.options.context_bytes)
+            start = max(offset, start - context_bytes)
+            end = min(offset + max(len(left), len(right)), end + context_bytes)
             
             # Align start
-            start = (start // self.options.align_to) * self.options.align_to
+            start = (start // align_to) * align_to
         else:
             start = offset
             end = offset + max(len(left), len(right))
@@ -403,12 +1026,15 @@ class BinaryDiffEngine:
         rel_start = start - offset
         rel_end = end - offset
         
-        left_bytes = left[rel_start:rel_end] if rel_start < len(left) else b''
-        right_bytes = right[rel_start:rel_end] if rel_start < len(right) else b''
+        # Inputs may be views into a reused or mapped buffer, so the stored
+        # window is copied out; bytes() returns a bytes slice unchanged
+        left_bytes = bytes(left[rel_start:rel_end]) if rel_start < len(left) else b''
+        right_bytes = bytes(right[rel_start:rel_end]) if rel_start < len(right) else b''
         
-        # Relative difference offsets
-        diff_offsets = [d.offset - start for d in differences 
-                       if start <= d.offset < end]
+        # Relative difference offsets; the window is a contiguous run
+        first = bisect.bisect_left(diff_offsets, start)
+        last = bisect.bisect_left(diff_offsets, end, first)
+        diff_offsets = [d - start for d in diff_offsets[first:last]]
         
         return BinaryDiffChunk(
             offset=start,
@@ -422,50 +1048,54 @@ class BinaryDiffEngine:
         self,
         left_data: bytes,
         right_data: bytes,
-        differences: list[ByteDifference]
+        differences: DifferenceBuffer
     ) -> list[BinaryDiffChunk]:
-        """Build display chunks from a list of differences."""
+        """Build display chunks from a buffer of differences."""
         if not differences:
             return []
         
         chunks = []
+        offsets = differences.offsets
         
-        # Group differences that are close together
-        groups: list[list[ByteDifference]] = []
-        current_group: list[ByteDifference] = []
-        
-        for diff in differences:
-            if not current_group:
-                current_group = [diff]
-            elif diff.offset - current_group[-1].offset <= self.options.align_to * 2:
-                current_group.append(diff)
-            else:
-                groups.append(current_group)
-                current_group = [diff]
-        
-        if current_group:
-            groups.append(current_group)
+        # Group differences that are close together, as [start, end) index ranges
+        align_to = self.options.align_to
+        context_bytes = self.options.context_bytes
+        gap = align_to * 2
+        if NUMPY_AVAILABLE:
+            splits = np.flatnonzero(
+                np.diff(np.frombuffer(offsets, dtype=np.int64)) > gap
+            ) + 1
+            bounds = [0, *splits.tolist(), len(offsets)]
+        else:
+            bounds = [0]
+            bounds.extend(
+                i for i in range(1, len(offsets))
+                if offsets[i] - offsets[i - 1] > gap
+            )
+            bounds.append(len(offsets))
         
         # Create chunk for each group
-        for group in groups:
-            min_offset = min(d.offset for d in group)
-            max_offset = max(d.offset for d in group)
+        for gs, ge in zip(bounds, bounds[1:]):
+            group_offsets = offsets[gs:ge]
+            # Offsets are ascending, so the group's extremes are its ends
+            min_offset = group_offsets[0]
+            max_offset = group_offsets[-1]
             
             # Align and add context
-            start = (min_offset // self.options.align_to) * self.options.align_to
-            start = max(0, start - self.options.context_bytes)
-            start = (start // self.options.align_to) * self.options.align_to
+            start = (min_offset // align_to) * align_to
+            start = max(0, start - context_bytes)
+            start = (start // align_to) * align_to
             
-            end = ((max_offset // self.options.align_to) + 1) * self.options.align_to
-            end += self.options.context_bytes
+            end = ((max_offset // align_to) + 1) * align_to
+            end += context_bytes
             
             left_bytes = left_data[start:end] if start < len(left_data) else b''
             right_bytes = right_data[start:end] if start < len(right_data) else b''
             
             # Determine type
-            if all(d.is_addition for d in group):
+            if max(differences.left_bytes[gs:ge]) < 0:
                 diff_type = BinaryDiffType.ADDED
-            elif all(d.is_deletion for d in group):
+            elif max(differences.right_bytes[gs:ge]) < 0:
                 diff_type = BinaryDiffType.REMOVED
             else:
                 diff_type = BinaryDiffType.MODIFIED
@@ -475,42 +1105,33 @@ class BinaryDiffEngine:
                 left_bytes=left_bytes,
                 right_bytes=right_bytes,
                 diff_type=diff_type,
-                diff_offsets=[d.offset - start for d in group]
+                diff_offsets=[d - start for d in group_offsets]
             ))
         
         return chunks
     
     def _format_hex_line(
         self,
-        data: bytes,
+        data: bytes | memoryview,
         offset: int,
-        bytes_per_line: int
+        bytes_per_line: int,
+        ascii_text: Optional[str] = None
     ) -> str:
-        """Format a single line of hex dump."""
+        """
+        Format a single line of hex dump.
+        
+        ascii_text may carry the already translated ASCII column of data.
+        """
         if not data:
             return f"{offset:08X}: " + "   " * bytes_per_line + " | "
         
-        line = f"{offset:08X}: "
-        
-        # Hex bytes
-        hex_parts = []
-        for i in range(bytes_per_line):
-            if i < len(data):
-                hex_parts.append(f"{data[i]:02X}")
-            else:
-                hex_parts.append("  ")
-        
-        line += " ".join(hex_parts)
+        hex_str = data[:bytes_per_line].hex(' ').upper()
+        padding = "   " * max(0, bytes_per_line - len(data))
         
-        # ASCII
-        line += " | "
-        for byte in data:
-            if 32 <= byte < 127:
-                line += chr(byte)
-            else:
-                line += "."
+        if ascii_text is None:
+            ascii_text = bytes(data).translate(_ASCII_TABLE).decode('ascii')
         
-        return line
+        return f"{offset:08X}: {hex_str}{padding} | {ascii_text}"
 
 
 class BinaryPatch:
@@ -520,7 +1141,10 @@ class BinaryPatch:
     Uses a simple format storing offset, length, and replacement bytes.
     """
     
-    MAGIC = b'BPATCH01'
+    MAGIC = b'BPATCH02'
+    LEGACY_MAGIC = b'BPATCH01'  # Records interleaved with their payloads
+    MAX_EDIT_DISTANCE = 512  # Edit script search limit before falling back
+    MAX_ENTRY_LENGTH = 0xFFFF  # Largest length a patch record can hold
     
     @dataclass
     class PatchEntry:
@@ -536,11 +1160,48 @@ class BinaryPatch:
         original: bytes,
         modified: bytes
     ) -> bytes:
-        """Create a patch that transforms original into modified."""
+        """
+        Create a patch that transforms original into modified.
+        
+        Uses a byte-level Myers edit script, so insertions and deletions
+        cost only the changed bytes. Inputs needing more than
+        MAX_EDIT_DISTANCE edits fall back to position-aligned comparison.
+        """
+        hunks = diff_bytes(original, modified, cls.MAX_EDIT_DISTANCE)
+        if hunks is None:
+            entries = cls._aligned_entries(original, modified)
+        else:
+            entries = [
+                cls.PatchEntry(
+                    offset=a_start,
+                    original_length=a_end - a_start,
+                    original_bytes=original[a_start:a_end],
+                    new_bytes=modified[b_start:b_end]
+                )
+                for a_start, a_end, b_start, b_end in hunks
+            ]
+        
+        # Record lengths are 16-bit
+        entries = [
+            piece for entry in entries for piece in cls._split_entry(entry)
+        ]
+        
+        # Serialize patch
+        return cls._serialize_patch(entries, len(original), len(modified))
+    
+    @classmethod
+    def _aligned_entries(
+        cls,
+        original: bytes,
+        modified: bytes
+    ) -> list[PatchEntry]:
+        """Build patch entries from a position-aligned byte comparison."""
         entries: list[cls.PatchEntry] = []
         
-        # Find differences
-        engine = BinaryDiffEngine()
+        # Find every difference; a truncated list would yield a partial patch
+        engine = BinaryDiffEngine(BinaryCompareOptions(
+            max_differences=max(len(original), len(modified), 1)
+        ))
         result = engine.compare_bytes(original, modified)
         
         # Group consecutive differences
@@ -577,8 +1238,24 @@ class BinaryPatch:
                     new_bytes=bytes(b for b in current_new if b is not None)
                 ))
         
-        # Serialize patch
-        return cls._serialize_patch(entries, len(original), len(modified))
+        return entries
+    
+    @classmethod
+    def _split_entry(cls, entry: PatchEntry) -> Iterator[PatchEntry]:
+        """Split an entry into pieces whose lengths fit a patch record."""
+        step = cls.MAX_ENTRY_LENGTH
+        span = max(entry.original_length, len(entry.new_bytes))
+        if span <= step:
+            yield entry
+            return
+        
+        for start in range(0, span, step):
+            yield cls.PatchEntry(
+                offset=entry.offset + min(start, entry.original_length),
+                original_length=max(0, min(step, entry.original_length - start)),
+                original_bytes=entry.original_bytes[start:start + step],
+                new_bytes=entry.new_bytes[start:start + step]
+            )
     
     @classmethod
     def apply_patch(
@@ -616,25 +1293,32 @@ class BinaryPatch:
         orig_size: int,
         new_size: int
     ) -> bytes:
-        """Serialize patch entries to bytes."""
-        import struct
-        
-        data = bytearray(cls.MAGIC)
-        
-        # Header: original size, new size, entry count
-        data.extend(struct.pack('<QQI', orig_size, new_size, len(entries)))
+        """
+        Serialize patch entries to bytes.
         
-        # Entries
-        for entry in entries:
-            data.extend(struct.pack('<QHH',
-                entry.offset,
-                entry.original_length,
-                len(entry.new_bytes)
-            ))
-            data.extend(entry.original_bytes)
-            data.extend(entry.new_bytes)
+        Layout: magic, '<QQI' header, one '<QHH' record per entry, then
+        each entry's original and new bytes back to back. The records are
+        packed in a single struct call and the payload in a single join.
+        """
+        records = struct.pack(
+            '<' + 'QHH' * len(entries),
+            *itertools.chain.from_iterable(
+                (entry.offset, entry.original_length, len(entry.new_bytes))
+                for entry in entries
+            )
+        )
+        payload = b''.join(
+            itertools.chain.from_iterable(
+                (entry.original_bytes, entry.new_bytes) for entry in entries
+            )
+        )
         
-        return bytes(data)
+        return b''.join((
+            cls.MAGIC,
+            struct.pack('<QQI', orig_size, new_size, len(entries)),
+            records,
+            payload
+        ))
     
     @classmethod
     def _deserialize_patch(
@@ -642,13 +1326,50 @@ class BinaryPatch:
         patch: bytes
     ) -> tuple[list[PatchEntry], int, int]:
         """Deserialize patch from bytes."""
-        import struct
+        if patch.startswith(cls.LEGACY_MAGIC):
+            return cls._deserialize_legacy_patch(patch)
         
         if not patch.startswith(cls.MAGIC):
             raise ValueError("Invalid patch format")
         
         pos = len(cls.MAGIC)
         
+        # Header
+        orig_size, new_size, entry_count = struct.unpack_from('<QQI', patch, pos)
+        pos += 20
+        
+        records = struct.unpack_from('<' + 'QHH' * entry_count, patch, pos)
+        pos += 12 * entry_count
+        
+        entries = []
+        for i in range(0, len(records), 3):
+            offset, orig_len, new_len = records[i:i + 3]
+            
+            # Only the part of the replaced range inside the original is stored
+            stored_len = max(0, min(orig_len, orig_size - offset))
+            orig_bytes = patch[pos:pos + stored_len]
+            pos += stored_len
+            
+            new_bytes = patch[pos:pos + new_len]
+            pos += new_len
+            
+            entries.append(cls.PatchEntry(
+                offset=offset,
+                original_length=orig_len,
+                original_bytes=orig_bytes,
+                new_bytes=new_bytes
+            ))
+        
+        return entries, orig_size, new_size
+    
+    @classmethod
+    def _deserialize_legacy_patch(
+        cls,
+        patch: bytes
+    ) -> tuple[list[PatchEntry], int, int]:
+        """Deserialize a patch in the original interleaved format."""
+        pos = len(cls.LEGACY_MAGIC)
+        
         # Header
         orig_size, new_size, entry_count = struct.unpack('<QQI', patch[pos:pos + 20])
         pos += 20
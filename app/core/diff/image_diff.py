@@ -11,20 +11,55 @@ Provides visual comparison of images with:
 from __future__ import annotations
 
 import io
+import os
+import hashlib
+import logging
+import functools
+import contextlib
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional, Callable, Tuple
+from collections.abc import Sequence
+from typing import Iterator, Optional, Callable, Tuple, TypeVar
 
 # Image processing - PIL/Pillow
 try:
-    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageEnhance
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageEnhance, UnidentifiedImageError
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# Array access to pixel data - NumPy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Connected-component labeling - SciPy
+try:
+    from scipy import ndimage
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from app.core.diff import _image_kernels
 from app.core.models import ImageDiffResult, ImageDiffRegion
 
+T = TypeVar('T')
+
+# Upper bound on threads used to difference image strips
+MAX_STRIP_WORKERS = 8
+
+# Modes the engine compares without converting
+_COMPARABLE_MODES = ('RGB', 'RGBA', 'L')
+
+# Weights for turning an 8-bit histogram into a sum of intensities
+if NUMPY_AVAILABLE:
+    _INTENSITIES = np.arange(256, dtype=np.int64)
+
 
 class ImageDiffMode(Enum):
     """Image comparison visualization modes."""
@@ -86,6 +121,88 @@ class PixelDifference:
     difference: float  # 0.0 to 1.0
 
 
+@functools.lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> bytes:
+    """
+    BLAKE2b digest of a file's contents.
+    
+    Size and modification time are part of the cache key, so an edited
+    file is hashed again rather than served from the cache.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+class RegionBuffer(Sequence[ImageDiffRegion]):
+    """
+    Compact storage for image difference regions.
+    
+    Keeps region bounds and pixel counts in parallel NumPy arrays rather
+    than a list of objects. ImageDiffRegion objects are only created when
+    an item is accessed.
+    """
+    
+    __slots__ = ('x', 'y', 'width', 'height', 'pixel_count', 'image_pixels')
+    
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray,
+        pixel_count: np.ndarray,
+        image_pixels: int
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.pixel_count = pixel_count
+        self.image_pixels = image_pixels  # Used for difference_ratio
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RegionBuffer(
+                self.x[index], self.y[index], self.width[index],
+                self.height[index], self.pixel_count[index], self.image_pixels
+            )
+        
+        return self._make_region(
+            int(self.x[index]), int(self.y[index]), int(self.width[index]),
+            int(self.height[index]), int(self.pixel_count[index])
+        )
+    
+    def __iter__(self) -> Iterator[ImageDiffRegion]:
+        for fields in zip(
+            self.x.tolist(), self.y.tolist(), self.width.tolist(),
+            self.height.tolist(), self.pixel_count.tolist()
+        ):
+            yield self._make_region(*fields)
+    
+    def _make_region(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        pixel_count: int
+    ) -> ImageDiffRegion:
+        return ImageDiffRegion(
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            pixel_count=pixel_count,
+            difference_ratio=pixel_count / self.image_pixels if self.image_pixels > 0 else 0
+        )
+
+
 class ImageDiffEngine:
     """
     Engine for comparing image files.
@@ -100,6 +217,23 @@ class ImageDiffEngine:
                 "Install with: pip install Pillow"
             )
         self.options = options or ImageCompareOptions()
+        
+        # id(image) -> (weak reference, pixel core, PixelAccess) for get_pixel_info
+        self._pixel_access_cache: dict[int, tuple] = {}
+        
+        # (tolerance, bands) -> point() lookup table
+        self._tolerance_lut_cache: dict[tuple[int, int], bytes] = {}
+    
+    @property
+    def _internal_resample(self) -> int:
+        """
+        Resampling filter for size matching before a comparison.
+        
+        Box costs about half as much as Lanczos and is accurate enough for
+        a pixel difference; Lanczos stays in the view helpers whose output
+        is only ever looked at.
+        """
+        return Image.BOX if self.options.antialias else Image.NEAREST
     
     
     def _compare_images_visual(
@@ -107,7 +241,7 @@ class ImageDiffEngine:
         left_img: Image.Image,
         right_img: Image.Image,
         progress_callback: Optional[Callable[[int, int], None]] = None
-    ) -> Tuple[Image.Image, float, list[ImageDiffRegion]]:
+    ) -> Tuple[Image.Image, float, Sequence[ImageDiffRegion]]:
         """
         Perform the actual visual comparison logic.
         
@@ -119,17 +253,142 @@ class ImageDiffEngine:
         Returns:
             Tuple of (difference_image, similarity, regions)
         """
+        diff_sum = change_mask = None
+        if self._can_diff_arrays(left_img, right_img):
+            diff_img, diff_sum, change_mask = self._difference_from_arrays(
+                left_img, right_img, progress_callback
+            )
+        else:
+            diff_img = self._difference_from_strips(left_img, right_img, progress_callback)
+
+        if diff_sum is not None:
+            similarity = self._similarity_from_sum(
+                diff_sum, diff_img.width * diff_img.height
+            )
+        else:
+            # Calculate similarity using histogram
+            similarity = self._calculate_similarity_from_diff(diff_img)
+        
+        # Find difference regions
+        regions = self._find_diff_regions(diff_img, change_mask)
+        
+        # Amplify differences for visibility in the diff image if requested
+        if self.options.difference_amplification != 1.0:
+            enhancer = ImageEnhance.Contrast(diff_img)
+            diff_img = enhancer.enhance(self.options.difference_amplification)
+            
+        return diff_img, similarity, regions
+
+    # Rows processed per step, so progress is reported while large images diff
+    DIFF_STRIP_HEIGHT = 128
+    
+    @staticmethod
+    def _can_diff_arrays(left_img: Image.Image, right_img: Image.Image) -> bool:
+        """Whether both images can be differenced as NumPy arrays."""
+        return (
+            NUMPY_AVAILABLE
+            and left_img.mode == right_img.mode
+            and left_img.mode in _COMPARABLE_MODES
+            and left_img.size == right_img.size
+        )
+    
+    def _difference_from_arrays(
+        self,
+        left_img: Image.Image,
+        right_img: Image.Image,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[Image.Image, int, Optional[np.ndarray]]:
+        """
+        Compute the RGB difference image in one pass over NumPy buffers.
+        
+        |a - b| is computed as max(a, b) - min(a, b), so each strip is
+        differenced into the output buffer and one reused scratch strip
+        without widening to a larger dtype. Alpha never reaches the
+        RGB difference image, so RGBA input is differenced on its colour
+        channels only.
+        
+        The sum of the RGB difference image is accumulated strip by strip,
+        so similarity needs no histogram pass afterwards. With Numba
+        available a fused kernel also produces the change mask.
+        
+        Returns:
+            Tuple of (difference_image, difference_sum, change_mask); the
+            mask is None when Numba is not available
+        """
+        left = np.asarray(left_img)
+        right = np.asarray(right_img)
+        if left_img.mode == 'RGBA':
+            left = left[..., :3]
+            right = right[..., :3]
+        
+        height = left.shape[0]
+        out = np.empty(left.shape, dtype=np.uint8)
+        tolerance = self.options.tolerance
+        
+        fused = _image_kernels.NUMBA_AVAILABLE
+        if fused:
+            # The kernel takes (height, width, channels) for gray images too
+            if left.ndim == 2:
+                left, right = left[..., np.newaxis], right[..., np.newaxis]
+            out_channels = out.reshape(left.shape)
+            change_mask = np.empty(left.shape[:2], dtype=np.uint8)
+        else:
+            change_mask = None
+        
+        def diff_strip(y: int, y_end: int) -> int:
+            if fused:
+                return _image_kernels.diff_threshold_sum(
+                    left[y:y_end], right[y:y_end], tolerance,
+                    out_channels[y:y_end], change_mask[y:y_end]
+                )
+            
+            strip = out[y:y_end]
+            back = np.empty_like(strip)
+            
+            np.maximum(left[y:y_end], right[y:y_end], out=strip)
+            np.minimum(left[y:y_end], right[y:y_end], out=back)
+            np.subtract(strip, back, out=strip)
+            
+            # Apply tolerance branch-free: keep values above it, zero the rest
+            if tolerance > 0:
+                np.multiply(strip, strip > tolerance, out=strip)
+            
+            # Summed while the strip is still in cache
+            return int(strip.sum(dtype=np.int64))
+        
+        # The fused kernel already runs its rows on Numba's thread pool
+        diff_sum = 0
+        with contextlib.closing(
+            self._map_strips(diff_strip, height, threaded=not fused)
+        ) as strips:
+            for y_end, strip_sum in strips:
+                diff_sum += strip_sum
+                if progress_callback:
+                    progress_callback(y_end, height)
+        
+        diff_img = Image.fromarray(out)
+        if diff_img.mode != 'RGB':
+            # Grayscale differences are shown as RGB like the other modes,
+            # which repeats every difference value across three channels
+            diff_img = diff_img.convert('RGB')
+            diff_sum *= 3
+        return diff_img, diff_sum, change_mask
+    
+    def _difference_from_strips(
+        self,
+        left_img: Image.Image,
+        right_img: Image.Image,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Image.Image:
+        """Compute the difference image strip by strip with ImageChops."""
         width = left_img.width
         height = left_img.height
         
         # Calculate difference in chunks to support progress reporting
         # and stay responsive with large images
         diff_img = Image.new('RGB', (width, height))
-        chunk_height = 128
         
-        for y in range(0, height, chunk_height):
-            y_end = min(y + chunk_height, height)
-            
+        def diff_strip(y: int, y_end: int) -> Image.Image:
             left_crop = left_img.crop((0, y, width, y_end))
             right_crop = right_img.crop((0, y, width, y_end))
             
@@ -141,30 +400,77 @@ class ImageDiffEngine:
                 
             # Apply tolerance
             if self.options.tolerance > 0:
-                strip_diff = strip_diff.point(lambda p: 0 if p <= self.options.tolerance else p)
+                strip_diff = strip_diff.point(
+                    self._tolerance_lut(len(strip_diff.getbands()))
+                )
+            return strip_diff
+        
+        with contextlib.closing(self._map_strips(diff_strip, height)) as strips:
+            for y_end, strip_diff in strips:
+                diff_img.paste(strip_diff, (0, y_end - strip_diff.height))
                 
-            diff_img.paste(strip_diff, (0, y))
-            
-            if progress_callback:
-                progress_callback(y_end, height)
+                if progress_callback:
+                    progress_callback(y_end, height)
+        
+        return diff_img
 
-        # Calculate similarity using histogram
-        similarity = self._calculate_similarity_from_diff(diff_img)
+    def _map_strips(
+        self,
+        func: Callable[[int, int], T],
+        height: int,
+        threaded: bool = True
+    ) -> Iterator[Tuple[int, T]]:
+        """
+        Yield (y_end, func(y, y_end)) for each horizontal strip, in order.
         
-        # Find difference regions
-        regions = self._find_diff_regions(diff_img)
+        Strips are independent and NumPy and Pillow release the GIL while
+        they work on pixel buffers, so with several cores the strips run
+        on a thread pool while the caller consumes results in order.
+        Closing the iterator early cancels strips that have not started.
+        """
+        bounds = [
+            (y, min(y + self.DIFF_STRIP_HEIGHT, height))
+            for y in range(0, height, self.DIFF_STRIP_HEIGHT)
+        ]
+        workers = min(MAX_STRIP_WORKERS, os.cpu_count() or 1, len(bounds))
         
-        # Amplify differences for visibility in the diff image if requested
-        if self.options.difference_amplification != 1.0:
-            enhancer = ImageEnhance.Contrast(diff_img)
-            diff_img = enhancer.enhance(self.options.difference_amplification)
-            
-        return diff_img, similarity, regions
+        if not threaded or workers <= 1:
+            for y, y_end in bounds:
+                yield y_end, func(y, y_end)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(func, y, y_end) for y, y_end in bounds]
+            for (_, y_end), future in zip(bounds, futures):
+                yield y_end, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _tolerance_lut(self, bands: int) -> bytes:
+        """
+        Lookup table zeroing values at or below the tolerance.
+        
+        Tables are cached per (tolerance, bands) for the engine's lifetime,
+        so point() never calls back into Python and strips and repeated
+        comparisons reuse the same table.
+        """
+        key = (self.options.tolerance, bands)
+        lut = self._tolerance_lut_cache.get(key)
+        if lut is None:
+            tolerance = self.options.tolerance
+            lut = bytes(0 if p <= tolerance else p for p in range(256)) * bands
+            self._tolerance_lut_cache[key] = lut
+        return lut
 
     def _normalize_image(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
         """Normalize image mode and size for comparison."""
+        # Common case: already comparable, nothing to allocate
+        if img.size == size and img.mode in _COMPARABLE_MODES:
+            return img
+        
         target_mode = img.mode
-        if img.mode not in ('RGB', 'RGBA', 'L'):
+        if img.mode not in _COMPARABLE_MODES:
             target_mode = 'RGBA' if 'A' in img.mode else 'RGB'
             img = img.convert(target_mode)
             
@@ -179,6 +485,14 @@ class ImageDiffEngine:
         new_img.paste(img, (x, y))
         return new_img
 
+    @staticmethod
+    def _similarity_from_sum(diff_sum: int, pixel_count: int) -> float:
+        """Similarity ratio from the summed channels of an RGB difference image."""
+        max_diff = 255 * 3 * pixel_count
+        if max_diff == 0:
+            return 1.0
+        return 1.0 - (diff_sum / max_diff)
+
     def _calculate_similarity_from_diff(self, diff_img: Image.Image) -> float:
         """Calculate similarity ratio from a difference image using histogram."""
         hist = diff_img.histogram()
@@ -187,17 +501,21 @@ class ImageDiffEngine:
         if diff_img.mode in ('RGB', 'RGBA'):
             # In RGB(A), histogram is a list of 256 * channels values
             channels = 3 # We focus on RGB for similarity
-            hist_r = hist[0:256]
-            hist_g = hist[256:512]
-            hist_b = hist[512:768]
-            
-            diff_sum = 0
-            for i in range(256):
-                diff_sum += (hist_r[i] + hist_g[i] + hist_b[i]) * i
+            if NUMPY_AVAILABLE:
+                counts = np.asarray(hist[:768], dtype=np.int64).reshape(3, 256).sum(axis=0)
+                diff_sum = int(np.dot(counts, _INTENSITIES))
+            else:
+                diff_sum = sum(
+                    (r + g + b) * i
+                    for i, (r, g, b) in enumerate(zip(hist[0:256], hist[256:512], hist[512:768]))
+                )
                 
             max_diff = 255 * channels * total_pixels
         else:
-            diff_sum = sum(hist[i] * i for i in range(256))
+            if NUMPY_AVAILABLE:
+                diff_sum = int(np.dot(np.asarray(hist[:256], dtype=np.int64), _INTENSITIES))
+            else:
+                diff_sum = sum(hist[i] * i for i in range(256))
             max_diff = 255 * total_pixels
             
         if max_diff == 0:
@@ -228,14 +546,23 @@ class ImageDiffEngine:
         left_exists = left_path.exists() and left_path.is_file()
         right_exists = right_path.exists() and right_path.is_file()
         
+        # Byte-identical files need no pixel comparison at all
+        same_content = (
+            left_exists and right_exists
+            and self._same_file_content(left_path, right_path)
+        )
+        
         if left_exists:
-            left_img = Image.open(left_path)
+            left_img = self._open_image(left_path)
         else:
             # Create a small blank image if it doesn't exist
             left_img = Image.new('RGB', (1, 1), (0, 0, 0))
             
-        if right_exists:
-            right_img = Image.open(right_path)
+        if same_content:
+            # Same bytes decode to the same pixels
+            right_img = left_img
+        elif right_exists:
+            right_img = self._open_image(right_path)
         else:
             # Create a small blank image if it doesn't exist
             right_img = Image.new('RGB', (1, 1), (0, 0, 0))
@@ -247,19 +574,65 @@ class ImageDiffEngine:
         # Handle size differences
         size_match = left_info.dimensions == right_info.dimensions
         
+        left_img, right_img = self._align_images(left_img, right_img, size_match)
+        
+        if same_content:
+            difference_img = Image.new('RGB', left_img.size)
+            similarity = 1.0
+            regions = []
+            if progress_callback:
+                progress_callback(left_img.height, left_img.height)
+        else:
+            # Perform comparison using the specialized visual logic
+            difference_img, similarity, regions = self._compare_images_visual(
+                left_img, right_img, progress_callback
+            )
+        
+        # Generate visualization
+        visual_img = self._generate_visualization(
+            left_img, right_img, difference_img, regions
+        )
+        
+        return ImageDiffResult(
+            left_path=str(left_path) if left_exists else "",
+            right_path=str(right_path) if right_exists else "",
+            left_info=left_info,
+            right_info=right_info,
+            is_identical=similarity >= 1.0,
+            similarity=similarity,
+            left_image=left_img,
+            right_image=right_img,
+            difference_image=difference_img,
+            visualization_image=visual_img,
+            regions=regions,
+            size_match=size_match
+        )
+    
+    def _align_images(
+        self,
+        left_img: Image.Image,
+        right_img: Image.Image,
+        size_match: bool
+    ) -> Tuple[Image.Image, Image.Image]:
+        """Bring both images to a common mode and size for comparison."""
+        # Fast path: same size and the same directly comparable mode
+        if (size_match and left_img.mode == right_img.mode
+                and left_img.mode in _COMPARABLE_MODES):
+            return left_img, right_img
+        
         if not size_match:
             if not self.options.ignore_size_difference:
                 if self.options.resize_to_match:
                     # Resize to larger dimensions
                     target_size = (
-                        max(left_info.width, right_info.width),
-                        max(left_info.height, right_info.height)
+                        max(left_img.width, right_img.width),
+                        max(left_img.height, right_img.height)
                     )
-                    resample = Image.LANCZOS if self.options.antialias else Image.NEAREST
+                    resample = self._internal_resample
                     
-                    if left_info.dimensions != target_size:
+                    if left_img.size != target_size:
                         left_img = left_img.resize(target_size, resample)
-                    if right_info.dimensions != target_size:
+                    if right_img.size != target_size:
                         right_img = right_img.resize(target_size, resample)
         
         # Normalize modes
@@ -280,30 +653,7 @@ class ImageDiffEngine:
         left_img = self._normalize_image(left_img, (width, height))
         right_img = self._normalize_image(right_img, (width, height))
         
-        # Perform comparison using the specialized visual logic
-        difference_img, similarity, regions = self._compare_images_visual(
-            left_img, right_img, progress_callback
-        )
-        
-        # Generate visualization
-        visual_img = self._generate_visualization(
-            left_img, right_img, difference_img, regions
-        )
-        
-        return ImageDiffResult(
-            left_path=str(left_path) if left_exists else "",
-            right_path=str(right_path) if right_exists else "",
-            left_info=left_info,
-            right_info=right_info,
-            is_identical=similarity >= 1.0,
-            similarity=similarity,
-            left_image=left_img,
-            right_image=right_img,
-            difference_image=difference_img,
-            visualization_image=visual_img,
-            regions=regions,
-            size_match=size_match
-        )
+        return left_img, right_img
     
     def compare_bytes(
         self,
@@ -311,8 +661,8 @@ class ImageDiffEngine:
         right_data: bytes
     ) -> ImageDiffResult:
         """Compare two images from byte data."""
-        left_img = Image.open(io.BytesIO(left_data))
-        right_img = Image.open(io.BytesIO(right_data))
+        left_img = self._open_image(io.BytesIO(left_data))
+        right_img = self._open_image(io.BytesIO(right_data))
         
         left_info = ImageInfo(
             width=left_img.width,
@@ -338,8 +688,8 @@ class ImageDiffEngine:
                 max(left_img.width, right_img.width),
                 max(left_img.height, right_img.height)
             )
-            left_img = left_img.resize(target_size, Image.LANCZOS)
-            right_img = right_img.resize(target_size, Image.LANCZOS)
+            left_img = left_img.resize(target_size, self._internal_resample)
+            right_img = right_img.resize(target_size, self._internal_resample)
         
         if left_img.mode != right_img.mode:
             target_mode = 'RGBA' if 'A' in left_img.mode or 'A' in right_img.mode else 'RGB'
@@ -381,8 +731,8 @@ class ImageDiffEngine:
             right_img = right_img.resize(left_img.size, Image.LANCZOS)
         
         # Convert to RGBA
-        left_rgba = left_img.convert('RGBA')
-        right_rgba = right_img.convert('RGBA')
+        left_rgba = self._as_mode(left_img, 'RGBA')
+        right_rgba = self._as_mode(right_img, 'RGBA')
         
         # Blend
         return Image.blend(left_rgba, right_rgba, opacity)
@@ -430,15 +780,24 @@ class ImageDiffEngine:
     ) -> Image.Image:
         """Create a split view (slider-style) comparison."""
         # Ensure same size
+        result = None
         if left_img.size != right_img.size:
             target_size = (
                 max(left_img.width, right_img.width),
                 max(left_img.height, right_img.height)
             )
-            left_img = left_img.resize(target_size, Image.LANCZOS)
-            right_img = right_img.resize(target_size, Image.LANCZOS)
+            # Only a side that is not already at the target size needs
+            # resampling; a resized left image is new and can be drawn on
+            if left_img.size != target_size:
+                left_img = result = left_img.resize(target_size, Image.LANCZOS)
+            if right_img.size != target_size:
+                right_img = right_img.resize(target_size, Image.LANCZOS)
         
-        result = left_img.copy()
+        # Starting from left and pasting only the revealed part of right
+        # writes each output pixel once; a NumPy round trip measured 2-4x
+        # slower because converting to and from arrays repacks every pixel
+        if result is None:
+            result = left_img.copy()
         
         if vertical:
             split_x = int(left_img.width * split_position)
@@ -451,6 +810,47 @@ class ImageDiffEngine:
         
         return result
     
+    @staticmethod
+    def _same_file_content(left_path: Path, right_path: Path) -> bool:
+        """Whether two files hold the same bytes, by size and cached digest."""
+        left_stat = left_path.stat()
+        right_stat = right_path.stat()
+        if left_stat.st_size != right_stat.st_size:
+            return False
+        
+        return (
+            _file_digest(str(left_path), left_stat.st_size, left_stat.st_mtime_ns)
+            == _file_digest(str(right_path), right_stat.st_size, right_stat.st_mtime_ns)
+        )
+    
+    @staticmethod
+    def _open_image(source: Path | io.BytesIO) -> Image.Image:
+        """
+        Open and fully decode an image.
+        
+        Decoding once up front means later crops, conversions and resizes
+        all work from the same pixel buffer, and the file handle is closed
+        straight away. For paths, only the plugin registered for the file
+        extension is tried first, skipping format sniffing; files whose
+        content does not match their extension are retried with all
+        plugins.
+        """
+        formats = None
+        if isinstance(source, Path):
+            image_format = Image.registered_extensions().get(source.suffix.lower())
+            if image_format:
+                formats = (image_format,)
+        
+        try:
+            img = Image.open(source, formats=formats)
+        except UnidentifiedImageError:
+            if formats is None:
+                raise
+            img = Image.open(source)
+        
+        img.load()
+        return img
+    
     def _get_image_info(self, img: Image.Image, path: Path) -> ImageInfo:
         """Extract information from an image."""
         return ImageInfo(
@@ -467,12 +867,36 @@ class ImageDiffEngine:
         left_img: Image.Image,
         right_img: Image.Image,
         progress_callback: Optional[Callable[[int, int], None]]
-    ) -> Tuple[Image.Image, float, list[ImageDiffRegion]]:
+    ) -> Tuple[Image.Image, float, Sequence[ImageDiffRegion]]:
         """Deprecated. Use _compare_images_visual instead."""
         return self._compare_images_visual(left_img, right_img, progress_callback)
     
-    def _find_diff_regions(self, diff_img: Image.Image) -> list[ImageDiffRegion]:
-        """Find connected regions of differences."""
+    def _find_diff_regions(
+        self,
+        diff_img: Image.Image,
+        change_mask: Optional[np.ndarray] = None
+    ) -> Sequence[ImageDiffRegion]:
+        """
+        Find connected regions of differences.
+        
+        Args:
+            diff_img: Difference image
+            change_mask: Precomputed threshold of diff_img (255 where the
+                gray level is non-zero), if the diff step produced one
+        """
+        w, h = diff_img.size
+        
+        # Determine scale for performance
+        max_dim = max(w, h)
+        scale = max(1, max_dim // 512)
+        
+        if NUMPY_AVAILABLE:
+            if change_mask is None:
+                # Convert to grayscale; any gray level > 0 is a change
+                gray = self._as_mode(diff_img, 'L')
+                change_mask = np.asarray(gray)
+            return self._find_regions_in_mask(change_mask > 0, scale)
+        
         regions = []
         
         # Convert to grayscale and threshold immediately (any diff > 0 is a change)
@@ -482,87 +906,185 @@ class ImageDiffEngine:
             gray = diff_img
         
         threshold = gray.point(lambda p: 255 if p > 0 else 0)
-        w, h = threshold.size
         
-        # Determine scale for performance
-        max_dim = max(w, h)
-        if max_dim <= 512:
-            scale = 1
+        if scale == 1:
             small = threshold
         else:
-            scale = max_dim // 512
             # Use MaxFilter to ensure tiny differences aren't lost when downscaling
             dilated = threshold.filter(ImageFilter.MaxFilter(scale * 2 - 1))
             small = dilated.resize((w // scale, h // scale), Image.NEAREST)
+        
+        for min_x, min_y, max_x, max_y in self._flood_fill_regions(small.tobytes(), *small.size):
+            # Convert back to original coordinates
+            # Multiplying by scale maps the top-left of the small grid cell
+            orig_x = min_x * scale
+            orig_y = min_y * scale
             
-        small_w, small_h = small.size
-        pixels = small.load()
+            # We add scale to the width/height to cover the full range of modified small pixels
+            orig_w = (max_x - min_x + 1) * scale
+            orig_h = (max_y - min_y + 1) * scale
+            
+            # Calculate actual bounds in threshold image
+            x1, y1 = max(0, orig_x), max(0, orig_y)
+            x2, y2 = min(w, x1 + orig_w), min(h, y1 + orig_h)
+            
+            # Refined crop to count actual pixels in the region
+            region_crop = threshold.crop((x1, y1, x2, y2))
+            true_diff_count = sum(1 for p in region_crop.getdata() if p > 0)
+            
+            if true_diff_count >= self.options.min_region_size:
+                regions.append(ImageDiffRegion(
+                    x=x1,
+                    y=y1,
+                    width=x2 - x1,
+                    height=y2 - y1,
+                    pixel_count=true_diff_count,
+                    difference_ratio=true_diff_count / (w * h) if w * h > 0 else 0
+                ))
         
-        visited = set()
+        return regions
+    
+    def _find_regions_in_mask(self, mask: np.ndarray, scale: int) -> RegionBuffer:
+        """
+        Find connected regions in a boolean change mask.
         
-        for y in range(small_h):
-            for x in range(small_w):
-                if pixels[x, y] > 0 and (x, y) not in visited:
-                    # Start of a new region - flood fill
-                    stack = [(x, y)]
-                    visited.add((x, y))
-                    
-                    min_x, min_y = x, y
-                    max_x, max_y = x, y
-                    diff_blocks = 0
-                    
-                    while stack:
-                        cx, cy = stack.pop()
-                        diff_blocks += 1
-                        
-                        min_x = min(min_x, cx)
-                        min_y = min(min_y, cy)
-                        max_x = max(max_x, cx)
-                        max_y = max(max_y, cy)
-                        
-                        # Check neighbors (4-connectivity)
-                        for nx, ny in [(cx+1, cy), (cx-1, cy), (cx, cy+1), (cx, cy-1)]:
-                            if 0 <= nx < small_w and 0 <= ny < small_h:
-                                if pixels[nx, ny] > 0 and (nx, ny) not in visited:
-                                    visited.add((nx, ny))
-                                    stack.append((nx, ny))
-                    
-                    # Convert back to original coordinates
-                    # Multiplying by scale maps the top-left of the small grid cell
-                    orig_x = min_x * scale
-                    orig_y = min_y * scale
-                    
-                    # We add scale to the width/height to cover the full range of modified small pixels
-                    orig_w = (max_x - min_x + 1) * scale
-                    orig_h = (max_y - min_y + 1) * scale
-                    
-                    # Calculate actual bounds in threshold image
-                    x1, y1 = max(0, orig_x), max(0, orig_y)
-                    x2, y2 = min(w, x1 + orig_w), min(h, y1 + orig_h)
-                    
-                    # Refined crop to count actual pixels in the region
-                    region_crop = threshold.crop((x1, y1, x2, y2))
-                    region_data = list(region_crop.getdata())
-                    true_diff_count = sum(1 for p in region_data if p > 0)
-                    
-                    if true_diff_count >= self.options.min_region_size:
-                        regions.append(ImageDiffRegion(
-                            x=x1,
-                            y=y1,
-                            width=x2 - x1,
-                            height=y2 - y1,
-                            pixel_count=true_diff_count,
-                            difference_ratio=true_diff_count / (w * h) if w * h > 0 else 0
-                        ))
+        Connectivity is found on a grid of scale x scale blocks. Region
+        bounds and pixel counts are then computed for all regions at once
+        from a summed-area table of the per-block counts; region boxes
+        are block-aligned, so four table lookups count a region exactly.
+        """
+        h, w = mask.shape
+        counts = self._block_counts(mask, scale)
         
-        return regions
+        if SCIPY_AVAILABLE:
+            boxes = self._label_regions(counts > 0)
+        else:
+            small = counts > 0
+            boxes = self._flood_fill_regions(small.tobytes(), small.shape[1], small.shape[0])
+        # Columns: min_x, min_y, max_x, max_y in block coordinates
+        boxes = np.array(boxes, dtype=np.int64).reshape(-1, 4)
+        
+        table = np.zeros((counts.shape[0] + 1, counts.shape[1] + 1), dtype=np.int64)
+        np.cumsum(counts, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        
+        left, top = boxes[:, 0], boxes[:, 1]
+        right, bottom = boxes[:, 2] + 1, boxes[:, 3] + 1
+        pixel_count = (
+            table[bottom, right] - table[top, right]
+            - table[bottom, left] + table[top, left]
+        )
+        
+        # Back to pixel coordinates, clipped to the image
+        keep = pixel_count >= self.options.min_region_size
+        x1 = left[keep] * scale
+        y1 = top[keep] * scale
+        return RegionBuffer(
+            x=x1,
+            y=y1,
+            width=np.minimum(w, right[keep] * scale) - x1,
+            height=np.minimum(h, bottom[keep] * scale) - y1,
+            pixel_count=pixel_count[keep],
+            image_pixels=w * h
+        )
+    
+    @staticmethod
+    def _block_counts(mask: np.ndarray, scale: int) -> np.ndarray:
+        """
+        Count the set pixels in each scale x scale block of a mask.
+        
+        Partial blocks at the right and bottom edges are padded, so every
+        changed pixel lands in exactly the cell its coordinates map to.
+        """
+        if scale == 1:
+            return mask.astype(np.int64)
+        
+        h, w = mask.shape
+        small_h = -(-h // scale)
+        small_w = -(-w // scale)
+        padded = np.zeros((small_h * scale, small_w * scale), dtype=bool)
+        padded[:h, :w] = mask
+        return np.count_nonzero(
+            padded.reshape(small_h, scale, small_w, scale), axis=(1, 3)
+        )
+    
+    @staticmethod
+    def _label_regions(mask: np.ndarray) -> list[Tuple[int, int, int, int]]:
+        """
+        Bounding boxes of the 4-connected non-zero areas of a mask.
+        
+        Labeling runs in a single SciPy pass; boxes are returned as
+        inclusive (min_x, min_y, max_x, max_y) in raster order of each
+        area's first pixel.
+        """
+        labels, _ = ndimage.label(mask)
+        return [
+            (cols.start, rows.start, cols.stop - 1, rows.stop - 1)
+            for rows, cols in ndimage.find_objects(labels)
+        ]
+    
+    @staticmethod
+    def _flood_fill_regions(
+        pixels: bytes,
+        small_w: int,
+        small_h: int
+    ) -> list[Tuple[int, int, int, int]]:
+        """
+        Pure-Python fallback for _label_regions when SciPy is missing.
+        
+        Pixels are read from the flat, row-major mask bytes and tracked in
+        a flat visited bytearray, so the inner loop indexes plain buffers
+        instead of going through PixelAccess and a set of coordinate tuples.
+        """
+        boxes = []
+        visited = bytearray(len(pixels))
+        
+        for start, value in enumerate(pixels):
+            if not value or visited[start]:
+                continue
+            
+            # Start of a new region - flood fill
+            stack = [start]
+            visited[start] = 1
+            
+            min_x = max_x = start % small_w
+            min_y = max_y = start // small_w
+            
+            while stack:
+                index = stack.pop()
+                cy, cx = divmod(index, small_w)
+                
+                if cx < min_x:
+                    min_x = cx
+                elif cx > max_x:
+                    max_x = cx
+                if cy > max_y:
+                    max_y = cy
+                
+                # Check neighbors (4-connectivity)
+                if cx + 1 < small_w and pixels[index + 1] and not visited[index + 1]:
+                    visited[index + 1] = 1
+                    stack.append(index + 1)
+                if cx > 0 and pixels[index - 1] and not visited[index - 1]:
+                    visited[index - 1] = 1
+                    stack.append(index - 1)
+                if cy + 1 < small_h and pixels[index + small_w] and not visited[index + small_w]:
+                    visited[index + small_w] = 1
+                    stack.append(index + small_w)
+                if cy > 0 and pixels[index - small_w] and not visited[index - small_w]:
+                    visited[index - small_w] = 1
+                    stack.append(index - small_w)
+            
+            boxes.append((min_x, min_y, max_x, max_y))
+        
+        return boxes
     
     def _generate_visualization(
         self,
         left_img: Image.Image,
         right_img: Image.Image,
         diff_img: Image.Image,
-        regions: list[ImageDiffRegion]
+        regions: Sequence[ImageDiffRegion]
     ) -> Image.Image:
         """Generate visualization based on selected mode."""
         mode = self.options.mode
@@ -592,11 +1114,12 @@ class ImageDiffEngine:
         self,
         left_img: Image.Image,
         right_img: Image.Image,
-        regions: list[ImageDiffRegion]
+        regions: Sequence[ImageDiffRegion]
     ) -> Image.Image:
         """Create image with difference regions highlighted."""
-        # Convert to RGBA for transparency support
-        result = left_img.convert('RGBA')
+        # Convert to RGBA for transparency support; the result is only
+        # written to after ImageEnhance or alpha_composite made a new image
+        result = self._as_mode(left_img, 'RGBA')
         
         # Create highlight overlay
         overlay = Image.new('RGBA', result.size, (0, 0, 0, 0))
@@ -609,6 +1132,11 @@ class ImageDiffEngine:
         if style == HighlightStyle.CIRCLE:
             enhancer = ImageEnhance.Brightness(result)
             result = enhancer.enhance(0.4)  # 60% darker
+            
+            # Circles reveal right_img through one shared mask; the masks
+            # are binary, so pasting their union once matches pasting each
+            spotlight_mask = Image.new('L', result.size, 0)
+            spotlight_draw = ImageDraw.Draw(spotlight_mask)
         
         for region in regions:
             bbox = (region.x, region.y, 
@@ -638,20 +1166,56 @@ class ImageDiffEngine:
                 # Draw circle outline
                 draw.ellipse(circle_bbox, outline=color[:3], width=3)
                 
-                # Paste modified pixels from right_img inside the circle
-                # Create a circular mask for this region
-                mask = Image.new('L', result.size, 0)
-                mask_draw = ImageDraw.Draw(mask)
-                mask_draw.ellipse(circle_bbox, fill=255)
-                
-                # Combine right_img content into the result
-                result.paste(right_img.convert('RGBA'), (0, 0), mask)
+                # Modified pixels from right_img show inside the circle
+                spotlight_draw.ellipse(circle_bbox, fill=255)
+        
+        if style == HighlightStyle.CIRCLE and regions:
+            # Combine right_img content into the result
+            right_rgba = self._as_mode(right_img, 'RGBA')
+            result.paste(right_rgba, (0, 0), spotlight_mask)
         
         # Composite the highlights on top
         result = Image.alpha_composite(result, overlay)
         
         return result
     
+    @staticmethod
+    def _as_mode(img: Image.Image, mode: str) -> Image.Image:
+        """
+        Return img in the given mode, converting only when needed.
+        
+        convert() copies the whole image even when the mode already
+        matches, so read-only uses go through this instead.
+        """
+        return img if img.mode == mode else img.convert(mode)
+    
+    def _pixel_access(self, img: Image.Image):
+        """
+        Return a cached PixelAccess for an image.
+        
+        Hover lookups query the same few images over and over, so the
+        access object is kept per image instead of going through
+        getpixel() on every call. Pillow images are unhashable, so entries
+        are keyed by id() and dropped when the image is collected; a
+        changed pixel core (e.g. after an in-place mode change) is
+        re-loaded.
+        """
+        key = id(img)
+        entry = self._pixel_access_cache.get(key)
+        if entry is not None and entry[0]() is img and entry[1] is img.im:
+            return entry[2]
+        
+        access = img.load()
+        cache = self._pixel_access_cache
+        
+        def forget(ref, key=key):
+            # The id may already belong to a newer image
+            if cache.get(key, (None,))[0] is ref:
+                del cache[key]
+        
+        cache[key] = (weakref.ref(img, forget), img.im, access)
+        return access
+    
     def get_pixel_info(
         self,
         img: Image.Image,
@@ -662,7 +1226,7 @@ class ImageDiffEngine:
         if x < 0 or x >= img.width or y < 0 or y >= img.height:
             return {'error': 'Coordinates out of bounds'}
         
-        pixel = img.getpixel((x, y))
+        pixel = self._pixel_access(img)[x, y]
         
         info = {
             'x': x,
@@ -706,8 +1270,18 @@ def check_image_support() -> dict:
         except Exception:
             pass
     
+    # Pillow-SIMD releases carry a '.postN' suffix on the Pillow version
+    # they track
+    pillow_version = Image.__version__ if hasattr(Image, '__version__') else 'unknown'
+    simd = '.post' in pillow_version
+    logging.info(
+        f"ImageDiffEngine - Pillow {pillow_version} "
+        f"({'SIMD build' if simd else 'standard build'})"
+    )
+    
     return {
         'available': True,
         'formats': formats,
-        'pillow_version': Image.__version__ if hasattr(Image, '__version__') else 'unknown'
+        'pillow_version': pillow_version,
+        'pillow_simd': simd
     }
\ No newline at end of file
@@ -12,11 +12,23 @@ Provides line-by-line comparison with support for:
 
 from __future__ import annotations
 
+import bisect
 import difflib
+import functools
+import itertools
 import re
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Iterator, Optional, Sequence, Callable
+from typing import Iterable, Iterator, Optional, Sequence, Callable, TextIO
+
+# C line matching - cdifflib
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+    CDIFFLIB_AVAILABLE = True
+except ImportError:
+    from difflib import SequenceMatcher
+    CDIFFLIB_AVAILABLE = False
 
 from app.core.models import (
     DiffLine,
@@ -27,6 +39,16 @@ from app.core.models import (
     LinePair,
 )
 
+# Read buffer for compare_files; large reads mean fewer decode calls
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Line-number gutters kept formatted; covers every line of files up to
+# this length so repeated side-by-side renders do not thrash the cache
+LINE_PREFIX_CACHE_SIZE = 1 << 14
+
+# Runs of whitespace or non-whitespace, for word-level intraline diffs
+_TOKEN_RE = re.compile(r'\s+|\S+')
+
 
 class DiffAlgorithm(Enum):
     """Available diff algorithms."""
@@ -60,27 +82,64 @@ class TextCompareOptions:
     
     def normalize_line(self, line: str) -> str:
         """Normalize a line according to options."""
-        result = line
+        return self.line_normalizer()(line)
+    
+    def line_normalizer(self) -> Callable[[str], str]:
+        """
+        Build a function that normalizes lines for the current options.
+        
+        The option checks run once here rather than once per line, and
+        steps that a later step makes redundant are left out. Build a new
+        normalizer after changing options.
+        """
+        steps: list[Callable[[str], str]] = []
+        mode = self.whitespace_mode
         
-        # Handle line endings
-        if self.ignore_line_endings:
-            result = result.rstrip('\r\n')
+        # Handle line endings; rstrip() and split() already drop them
+        if self.ignore_line_endings and mode in (WhitespaceMode.EXACT,
+                                                 WhitespaceMode.IGNORE_LEADING):
+            steps.append(_strip_line_ending)
         
         # Handle whitespace
-        if self.whitespace_mode == WhitespaceMode.IGNORE_TRAILING:
-            result = result.rstrip()
-        elif self.whitespace_mode == WhitespaceMode.IGNORE_LEADING:
-            result = result.lstrip()
-        elif self.whitespace_mode == WhitespaceMode.IGNORE_ALL:
-            result = ''.join(result.split())
-        elif self.whitespace_mode == WhitespaceMode.NORMALIZE:
-            result = ' '.join(result.split())
+        if mode == WhitespaceMode.IGNORE_TRAILING:
+            steps.append(str.rstrip)
+        elif mode == WhitespaceMode.IGNORE_LEADING:
+            steps.append(str.lstrip)
+        elif mode == WhitespaceMode.IGNORE_ALL:
+            steps.append(_remove_whitespace)
+        elif mode == WhitespaceMode.NORMALIZE:
+            steps.append(_collapse_whitespace)
         
         # Handle case
         if self.ignore_case:
-            result = result.lower()
+            steps.append(str.lower)
         
-        return result
+        if not steps:
+            return _unchanged
+        return functools.reduce(_chain, steps)
+
+
+def _unchanged(line: str) -> str:
+    return line
+
+
+def _strip_line_ending(line: str) -> str:
+    return line.rstrip('\r\n')
+
+
+def _remove_whitespace(line: str) -> str:
+    # split() drops every Unicode whitespace character and, with join, is
+    # faster on CPython than str.translate with a deletion table or re.sub
+    return ''.join(line.split())
+
+
+def _collapse_whitespace(line: str) -> str:
+    return ' '.join(line.split())
+
+
+def _chain(first: Callable[[str], str], second: Callable[[str], str]) -> Callable[[str], str]:
+    """Compose two normalization steps into one function."""
+    return lambda line: second(first(line))
 
 
 @dataclass
@@ -106,6 +165,13 @@ class DiffStatistics:
         return self.unchanged_lines / total
 
 
+def _read_lines(path: str, encoding: str) -> list[str]:
+    """Read a text file's lines through a large read buffer."""
+    with open(path, 'r', encoding=encoding, errors='replace',
+              buffering=READ_BUFFER_SIZE) as f:
+        return f.readlines()
+
+
 class TextDiffEngine:
     """
     Engine for comparing text files.
@@ -141,18 +207,36 @@ class TextDiffEngine:
         right = list(right_lines)
         
         if self.options.ignore_blank_lines:
-            left, left_map = self._filter_blank_lines(left)
-            right, right_map = self._filter_blank_lines(right)
-        else:
-            left_map = {i: i for i in range(len(left))}
-            right_map = {i: i for i in range(len(right))}
-        
-        # Create normalized versions for comparison
-        left_normalized = [self.options.normalize_line(l) for l in left]
-        right_normalized = [self.options.normalize_line(r) for r in right]
+            left = self._filter_blank_lines(left)
+            right = self._filter_blank_lines(right)
+        
+        # Unchanged files are the common case; list equality compares
+        # lengths first and then each line in C
+        identical = left == right
+        
+        if not identical:
+            # Create normalized versions for comparison; blank lines, braces
+            # and imports repeat a lot, so each distinct line is normalized
+            # once. Each distinct normalized line is numbered so the diff
+            # algorithms hash and compare small ints instead of whole lines.
+            distinct = {*left, *right}
+            normalized = self._normalize_lines(distinct)
+            line_ids: dict[str, int] = {}
+            ids = {
+                line: line_ids.setdefault(normalized[line], len(line_ids))
+                for line in distinct
+            }
+            left_ids = [ids[l] for l in left]
+            right_ids = [ids[r] for r in right]
+            
+            # Lines may differ only in what the options ignore
+            identical = left_ids == right_ids
         
         # Get diff opcodes
-        opcodes = self._get_opcodes(left_normalized, right_normalized)
+        if identical:
+            opcodes = [('equal', 0, len(left), 0, len(right))] if left else []
+        else:
+            opcodes = self._get_opcodes(left_ids, right_ids, list(line_ids))
         
         # Build diff lines and hunks
         diff_lines: list[DiffLine] = []
@@ -160,10 +244,23 @@ class TextDiffEngine:
         hunks: list[DiffHunk] = []
         
         current_hunk_lines: list[DiffLine] = []
+        # Lines the current hunk covers on each side
+        hunk_left_count = hunk_right_count = 0
         hunk_start_left = 0
         hunk_start_right = 0
         in_hunk = False
-        context_buffer: list[DiffLine] = []
+        context_lines = self.options.context_lines
+        # Trailing context of the last equal run; holds at most context_lines
+        context_buffer: deque[DiffLine] = deque(maxlen=context_lines)
+        
+        # Statistics are tallied as lines are emitted; modified lines are
+        # counted per side and halved at the end
+        unchanged_count = added_count = removed_count = modified_count = 0
+        
+        # Pair types bound locally for the per-line pair construction
+        unchanged = DiffLineType.UNCHANGED
+        removed = DiffLineType.REMOVED
+        added = DiffLineType.ADDED
         
         for tag, i1, i2, j1, j2 in opcodes:
             if tag == 'equal':
@@ -172,34 +269,38 @@ class TextDiffEngine:
                 # Handle context for hunks
                 if in_hunk:
                     # Add leading context to current hunk
-                    context_to_add = equal_lines[:self.options.context_lines]
+                    context_to_add = equal_lines[:context_lines]
                     current_hunk_lines.extend(context_to_add)
+                    hunk_left_count += len(context_to_add)
+                    hunk_right_count += len(context_to_add)
                     
                     # Check if we should close the hunk
-                    if len(equal_lines) > self.options.context_lines * 2:
+                    if len(equal_lines) > context_lines * 2:
                         # Close current hunk
                         hunks.append(self._create_hunk(
-                            current_hunk_lines, hunk_start_left, hunk_start_right
+                            current_hunk_lines, hunk_start_left, hunk_start_right,
+                            hunk_left_count, hunk_right_count
                         ))
                         current_hunk_lines = []
+                        hunk_left_count = hunk_right_count = 0
                         in_hunk = False
                         
                         # Buffer trailing context for next hunk
-                        context_buffer = equal_lines[-self.options.context_lines:]
+                        context_buffer.clear()
+                        context_buffer.extend(equal_lines[-context_lines:])
                     else:
                         # Gap is small, keep in same hunk
-                        current_hunk_lines.extend(equal_lines[self.options.context_lines:])
+                        current_hunk_lines.extend(equal_lines[context_lines:])
+                        hunk_left_count += len(equal_lines) - len(context_to_add)
+                        hunk_right_count += len(equal_lines) - len(context_to_add)
                 else:
                     # Buffer context for potential next hunk
-                    context_buffer = equal_lines[-self.options.context_lines:] if equal_lines else []
+                    context_buffer.clear()
+                    context_buffer.extend(equal_lines[-context_lines:])
                 
                 diff_lines.extend(equal_lines)
-                for line in equal_lines:
-                    line_pairs.append(LinePair(
-                        left_line=line,
-                        right_line=line,
-                        pair_type=DiffLineType.UNCHANGED
-                    ))
+                unchanged_count += i2 - i1
+                line_pairs += [LinePair(line, line, unchanged) for line in equal_lines]
                     
             elif tag == 'replace':
                 # Modified lines - pair them up
@@ -208,11 +309,15 @@ class TextDiffEngine:
                     hunk_start_left = i1
                     hunk_start_right = j1
                     current_hunk_lines.extend(context_buffer)
-                    context_buffer = []
+                    hunk_left_count = hunk_right_count = len(context_buffer)
+                    context_buffer.clear()
                 
                 modified_pairs = self._create_modified_lines(
                     left, right, i1, i2, j1, j2
                 )
+                modified_count += (i2 - i1) + (j2 - j1)
+                hunk_left_count += i2 - i1
+                hunk_right_count += j2 - j1
                 
                 for left_line, right_line in modified_pairs:
                     if left_line:
@@ -234,18 +339,15 @@ class TextDiffEngine:
                     hunk_start_left = i1
                     hunk_start_right = j1
                     current_hunk_lines.extend(context_buffer)
-                    context_buffer = []
+                    hunk_left_count = hunk_right_count = len(context_buffer)
+                    context_buffer.clear()
                 
                 removed_lines = self._create_removed_lines(left, i1, i2)
                 diff_lines.extend(removed_lines)
                 current_hunk_lines.extend(removed_lines)
-                
-                for line in removed_lines:
-                    line_pairs.append(LinePair(
-                        left_line=line,
-                        right_line=None,
-                        pair_type=DiffLineType.REMOVED
-                    ))
+                removed_count += i2 - i1
+                hunk_left_count += i2 - i1
+                line_pairs += [LinePair(line, None, removed) for line in removed_lines]
                     
             elif tag == 'insert':
                 if not in_hunk:
@@ -253,31 +355,40 @@ class TextDiffEngine:
                     hunk_start_left = i1
                     hunk_start_right = j1
                     current_hunk_lines.extend(context_buffer)
-                    context_buffer = []
+                    hunk_left_count = hunk_right_count = len(context_buffer)
+                    context_buffer.clear()
                 
                 added_lines = self._create_added_lines(right, j1, j2, i1)
                 diff_lines.extend(added_lines)
                 current_hunk_lines.extend(added_lines)
-                
-                for line in added_lines:
-                    line_pairs.append(LinePair(
-                        left_line=None,
-                        right_line=line,
-                        pair_type=DiffLineType.ADDED
-                    ))
+                added_count += j2 - j1
+                hunk_right_count += j2 - j1
+                line_pairs += [LinePair(None, line, added) for line in added_lines]
         
         # Close final hunk
         if in_hunk and current_hunk_lines:
             hunks.append(self._create_hunk(
-                current_hunk_lines, hunk_start_left, hunk_start_right
+                current_hunk_lines, hunk_start_left, hunk_start_right,
+                hunk_left_count, hunk_right_count
             ))
         
         # Calculate statistics
-        stats = self._calculate_statistics(diff_lines, len(left_lines), len(right_lines))
+        stats = DiffStatistics(
+            total_lines_left=len(left_lines),
+            total_lines_right=len(right_lines),
+            added_lines=added_count,
+            removed_lines=removed_count,
+            modified_lines=modified_count // 2,
+            unchanged_lines=unchanged_count
+        )
         
-        # Calculate similarity
-        matcher = difflib.SequenceMatcher(None, left_normalized, right_normalized)
-        similarity = matcher.ratio()
+        # Calculate similarity from the opcodes already computed, using
+        # difflib's ratio formula 2 * matches / total
+        if identical:
+            similarity = 1.0
+        else:
+            matches = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == 'equal')
+            similarity = 2.0 * matches / (len(left) + len(right))
         
         return DiffResult(
             left_path=left_label,
@@ -309,20 +420,22 @@ class TextDiffEngine:
             DiffResult for the files
         """
         try:
-            with open(left_path, 'r', encoding=encoding, errors='replace') as f:
-                left_lines = f.readlines()
-            
-            with open(right_path, 'r', encoding=encoding, errors='replace') as f:
-                right_lines = f.readlines()
+            left_lines = _read_lines(left_path, encoding)
+            right_lines = _read_lines(right_path, encoding)
             
             return self.compare(left_lines, right_lines, left_path, right_path)
         except (PermissionError, OSError) as e:
             # Create an error result
             return DiffResult(
-                left_label=left_path,
-                right_label=right_path,
+                left_path=left_path,
+                right_path=right_path,
+                lines=[],
                 hunks=[],
-                stats=DiffStatistics(),
+                line_pairs=[],
+                is_identical=False,
+                is_binary=False,
+                similarity_ratio=0.0,
+                statistics=DiffStatistics(),
                 error=f"Error reading files: {str(e)}"
             )
     
@@ -403,24 +516,57 @@ class TextDiffEngine:
                 [IntralineDiff(0, len(right), 'changed')]
             )
         
+        left_diffs, right_diffs = self._word_diff(left, right)
+        return list(left_diffs), list(right_diffs)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _word_diff(
+        left: str,
+        right: str
+    ) -> tuple[tuple[IntralineDiff, ...], tuple[IntralineDiff, ...]]:
+        """
+        Word-level highlights for a stripped line pair.
+        
+        Depends only on the two strings, so results are memoized: blank
+        lines, braces and other repeated lines are matched once per
+        session instead of once per occurrence.
+        """
+        if left == right:
+            # e.g. lines that only differed in their line endings
+            return (), ()
+        
         left_diffs: list[IntralineDiff] = []
         right_diffs: list[IntralineDiff] = []
         
         # Use word-level diff first, then character-level for changed words
-        left_words = self._tokenize(left)
-        right_words = self._tokenize(right)
+        left_words = TextDiffEngine._tokenize(left)
+        right_words = TextDiffEngine._tokenize(right)
+        
+        if set(left_words).isdisjoint(right_words):
+            # Rewritten lines share no token, so the matcher would report
+            # a single replace, delete or insert of the whole line
+            if left and right:
+                return (
+                    (IntralineDiff(0, len(left), 'changed'),),
+                    (IntralineDiff(0, len(right), 'changed'),)
+                )
+            if left:
+                return (IntralineDiff(0, len(left), 'deleted'),), ()
+            return (), (IntralineDiff(0, len(right), 'inserted'),)
         
-        matcher = difflib.SequenceMatcher(None, left_words, right_words)
+        matcher = SequenceMatcher(None, left_words, right_words)
         
-        left_pos = 0
-        right_pos = 0
+        # Character offset of each token boundary
+        left_offsets = list(itertools.accumulate(map(len, left_words), initial=0))
+        right_offsets = list(itertools.accumulate(map(len, right_words), initial=0))
         
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             # Calculate character positions
-            left_start = sum(len(w) for w in left_words[:i1])
-            left_end = sum(len(w) for w in left_words[:i2])
-            right_start = sum(len(w) for w in right_words[:j1])
-            right_end = sum(len(w) for w in right_words[:j2])
+            left_start = left_offsets[i1]
+            left_end = left_offsets[i2]
+            right_start = right_offsets[j1]
+            right_end = right_offsets[j2]
             
             if tag == 'equal':
                 pass  # No highlighting needed
@@ -432,33 +578,56 @@ class TextDiffEngine:
             elif tag == 'insert':
                 right_diffs.append(IntralineDiff(right_start, right_end, 'inserted'))
         
-        return left_diffs, right_diffs
+        return tuple(left_diffs), tuple(right_diffs)
+    
+    def _normalize_lines(self, lines: Iterable[str]) -> dict[str, str]:
+        """
+        Map lines to their normalized form under the current options.
+        
+        Callers pass distinct lines, so each one is normalized once per
+        compare however often it repeats.
+        """
+        normalize = self.options.line_normalizer()
+        return {line: normalize(line) for line in lines}
     
     def _get_opcodes(
         self,
-        left: list[str],
-        right: list[str]
+        left: list[int],
+        right: list[int],
+        lines: list[str]
     ) -> list[tuple[str, int, int, int, int]]:
-        """Get diff opcodes using the configured algorithm."""
+        """
+        Get diff opcodes using the configured algorithm.
+        
+        Args:
+            left: Line ids of the left side
+            right: Line ids of the right side
+            lines: Normalized line text for each id
+        """
+        isjunk = None
+        if self.options.junk_filter is not None:
+            junk_filter = self.options.junk_filter
+            isjunk = lambda line_id: junk_filter(lines[line_id])
+        
         if self.options.algorithm == DiffAlgorithm.PATIENCE:
             return self._patience_diff(left, right)
         elif self.options.algorithm == DiffAlgorithm.HISTOGRAM:
             return self._histogram_diff(left, right)
         elif self.options.algorithm == DiffAlgorithm.MINIMAL:
-            matcher = difflib.SequenceMatcher(
-                self.options.junk_filter, left, right, autojunk=False
+            matcher = SequenceMatcher(
+                isjunk, left, right, autojunk=False
             )
             return matcher.get_opcodes()
         else:  # MYERS (default)
-            matcher = difflib.SequenceMatcher(
-                self.options.junk_filter, left, right
+            matcher = SequenceMatcher(
+                isjunk, left, right
             )
             return matcher.get_opcodes()
     
     def _patience_diff(
         self,
-        left: list[str],
-        right: list[str]
+        left: list[int],
+        right: list[int]
     ) -> list[tuple[str, int, int, int, int]]:
         """
         Patience diff algorithm.
@@ -466,31 +635,18 @@ class TextDiffEngine:
         Better for code because it anchors on unique lines.
         """
         # Find unique lines in both sequences
-        left_unique = {}
-        right_unique = {}
-        
-        for i, line in enumerate(left):
-            if line in left_unique:
-                left_unique[line] = None  # Mark as non-unique
-            else:
-                left_unique[line] = i
-        
-        for i, line in enumerate(right):
-            if line in right_unique:
-                right_unique[line] = None
-            else:
-                right_unique[line] = i
-        
-        # Find common unique lines
-        common = []
-        for line, left_idx in left_unique.items():
-            if left_idx is not None and line in right_unique:
-                right_idx = right_unique[line]
-                if right_idx is not None:
-                    common.append((left_idx, right_idx, line))
-        
-        # Sort by position in left
-        common.sort()
+        left_counts = Counter(left)
+        right_counts = Counter(right)
+        right_unique = {
+            line: j for j, line in enumerate(right) if right_counts[line] == 1
+        }
+        
+        # Find common unique lines, already in left order
+        common = [
+            (i, right_unique[line], line)
+            for i, line in enumerate(left)
+            if left_counts[line] == 1 and line in right_unique
+        ]
         
         # Find LIS (Longest Increasing Subsequence) by right indices
         if common:
@@ -504,8 +660,8 @@ class TextDiffEngine:
     
     def _histogram_diff(
         self,
-        left: list[str],
-        right: list[str]
+        left: list[int],
+        right: list[int]
     ) -> list[tuple[str, int, int, int, int]]:
         """
         Histogram diff algorithm.
@@ -513,41 +669,34 @@ class TextDiffEngine:
         Uses line frequency to find good anchors.
         """
         # Count line frequencies
-        from collections import Counter
-        
         left_counts = Counter(left)
         right_counts = Counter(right)
         
-        # Find low-frequency common lines as anchors
-        common_lines = set(left_counts.keys()) & set(right_counts.keys())
-        
-        # Score by combined frequency (lower is better)
-        scored = [
-            (line, left_counts[line] + right_counts[line])
-            for line in common_lines
-        ]
-        scored.sort(key=lambda x: x[1])
-        
-        # Use low-frequency lines as anchors
-        anchor_lines = set(line for line, count in scored if count <= 3)
+        # Find low-frequency common lines as anchors; the combined
+        # frequency is the score (lower is better)
+        anchor_lines = {
+            line for line in left_counts.keys() & right_counts.keys()
+            if left_counts[line] + right_counts[line] <= 3
+        }
         
         if not anchor_lines:
             # Fall back to standard diff
-            matcher = difflib.SequenceMatcher(None, left, right)
+            matcher = SequenceMatcher(None, left, right)
             return matcher.get_opcodes()
         
-        # Find anchor positions
+        # First position of each anchor line in right, found in one pass
+        right_first: dict[int, int] = {}
+        for j, line in enumerate(right):
+            if line in anchor_lines and line not in right_first:
+                right_first[line] = j
+        
+        # Pair the first occurrence in left with it; popping means each
+        # anchor line is only used once. Anchors come out in left order.
         anchors = []
         for i, line in enumerate(left):
-            if line in anchor_lines:
-                # Find matching position in right
-                for j, rline in enumerate(right):
-                    if rline == line:
-                        anchors.append((i, j, line))
-                        anchor_lines.discard(line)  # Only use first occurrence
-                        break
-        
-        anchors.sort()
+            j = right_first.pop(line, None)
+            if j is not None:
+                anchors.append((i, j, line))
         
         # Filter to maintain order
         if anchors:
@@ -570,14 +719,8 @@ class TextDiffEngine:
         indices = []
         
         for i, val in enumerate(sequence):
-            # Binary search for position
-            lo, hi = 0, len(dp)
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if dp[mid] < val:
-                    lo = mid + 1
-                else:
-                    hi = mid
+            # Binary search for position (first dp entry >= val)
+            lo = bisect.bisect_left(dp, val)
             
             if lo == len(dp):
                 dp.append(val)
@@ -599,9 +742,9 @@ class TextDiffEngine:
     
     def _build_opcodes_from_anchors(
         self,
-        left: list[str],
-        right: list[str],
-        anchors: list[tuple[int, int, str]]
+        left: list[int],
+        right: list[int],
+        anchors: list[tuple[int, int, int]]
     ) -> list[tuple[str, int, int, int, int]]:
         """Build opcodes using anchor points."""
         opcodes = []
@@ -617,7 +760,7 @@ class TextDiffEngine:
                 gap_right = right[right_pos:right_idx]
                 
                 if gap_left and gap_right:
-                    matcher = difflib.SequenceMatcher(None, gap_left, gap_right)
+                    matcher = SequenceMatcher(None, gap_left, gap_right)
                     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
                         opcodes.append((
                             tag,
@@ -643,7 +786,7 @@ class TextDiffEngine:
             gap_right = right[right_pos:]
             
             if gap_left and gap_right:
-                matcher = difflib.SequenceMatcher(None, gap_left, gap_right)
+                matcher = SequenceMatcher(None, gap_left, gap_right)
                 for tag, i1, i2, j1, j2 in matcher.get_opcodes():
                     opcodes.append((
                         tag,
@@ -659,20 +802,9 @@ class TextDiffEngine:
         
         return opcodes
     
-    def _filter_blank_lines(
-        self,
-        lines: list[str]
-    ) -> tuple[list[str], dict[int, int]]:
-        """Filter out blank lines, returning filtered list and index mapping."""
-        filtered = []
-        mapping = {}
-        
-        for i, line in enumerate(lines):
-            if line.strip():
-                mapping[len(filtered)] = i
-                filtered.append(line)
-        
-        return filtered, mapping
+    def _filter_blank_lines(self, lines: list[str]) -> list[str]:
+        """Filter out blank lines."""
+        return [line for line in lines if line.strip()]
     
     def _create_equal_lines(
         self,
@@ -682,15 +814,14 @@ class TextDiffEngine:
         right_start: int
     ) -> list[DiffLine]:
         """Create DiffLine objects for equal lines."""
-        result = []
-        for i, idx in enumerate(range(start, end)):
-            result.append(DiffLine(
-                line_type=DiffLineType.UNCHANGED,
-                content=lines[idx],
-                left_line_num=idx + 1,
-                right_line_num=right_start + i + 1
-            ))
-        return result
+        # Positional construction with the type bound locally keeps this
+        # cheap for long unchanged runs
+        unchanged = DiffLineType.UNCHANGED
+        offset = right_start - start
+        return [
+            DiffLine(unchanged, lines[idx], idx + 1, idx + offset + 1)
+            for idx in range(start, end)
+        ]
     
     def _create_removed_lines(
         self,
@@ -699,15 +830,11 @@ class TextDiffEngine:
         end: int
     ) -> list[DiffLine]:
         """Create DiffLine objects for removed lines."""
-        result = []
-        for idx in range(start, end):
-            result.append(DiffLine(
-                line_type=DiffLineType.REMOVED,
-                content=lines[idx],
-                left_line_num=idx + 1,
-                right_line_num=None
-            ))
-        return result
+        removed = DiffLineType.REMOVED
+        return [
+            DiffLine(removed, lines[idx], idx + 1, None)
+            for idx in range(start, end)
+        ]
     
     def _create_added_lines(
         self,
@@ -717,15 +844,11 @@ class TextDiffEngine:
         left_pos: int
     ) -> list[DiffLine]:
         """Create DiffLine objects for added lines."""
-        result = []
-        for idx in range(start, end):
-            result.append(DiffLine(
-                line_type=DiffLineType.ADDED,
-                content=lines[idx],
-                left_line_num=None,
-                right_line_num=idx + 1
-            ))
-        return result
+        added = DiffLineType.ADDED
+        return [
+            DiffLine(added, lines[idx], None, idx + 1)
+            for idx in range(start, end)
+        ]
     
     def _create_modified_lines(
         self,
@@ -736,7 +859,15 @@ class TextDiffEngine:
         j1: int,
         j2: int
     ) -> list[tuple[Optional[DiffLine], Optional[DiffLine]]]:
-        """Create paired DiffLine objects for modified lines."""
+        """
+        Create paired DiffLine objects for modified lines.
+        
+        Intraline diffs are computed pair by pair on the calling thread.
+        difflib's matcher and cdifflib's both hold the GIL while they
+        hash and compare Python strings, so a thread pool would add
+        overhead without running pairs concurrently; repeated pairs are
+        served from the _word_diff cache instead.
+        """
         pairs = []
         
         left_lines = left[i1:i2]
@@ -749,16 +880,16 @@ class TextDiffEngine:
             left_line = None
             right_line = None
             
+            # Compute intraline diff once if we have both
+            intraline_left = None
+            intraline_right = None
+            if (self.options.compute_intraline
+                    and i < len(left_lines) and i < len(right_lines)):
+                intraline_left, intraline_right = self.compute_intraline_diff(
+                    left_lines[i], right_lines[i]
+                )
+            
             if i < len(left_lines):
-                # Compute intraline diff if we have both
-                intraline_left = None
-                intraline_right = None
-                
-                if self.options.compute_intraline and i < len(right_lines):
-                    intraline_left, intraline_right = self.compute_intraline_diff(
-                        left_lines[i], right_lines[i]
-                    )
-                
                 left_line = DiffLine(
                     line_type=DiffLineType.MODIFIED,
                     content=left_lines[i],
@@ -768,12 +899,6 @@ class TextDiffEngine:
                 )
             
             if i < len(right_lines):
-                intraline_right = None
-                if self.options.compute_intraline and i < len(left_lines):
-                    _, intraline_right = self.compute_intraline_diff(
-                        left_lines[i], right_lines[i]
-                    )
-                
                 right_line = DiffLine(
                     line_type=DiffLineType.MODIFIED,
                     content=right_lines[i],
@@ -790,12 +915,16 @@ class TextDiffEngine:
         self,
         lines: list[DiffLine],
         start_left: int,
-        start_right: int
+        start_right: int,
+        left_count: int,
+        right_count: int
     ) -> DiffHunk:
-        """Create a DiffHunk from a list of lines."""
-        left_count = sum(1 for l in lines if l.left_line_num is not None)
-        right_count = sum(1 for l in lines if l.right_line_num is not None)
+        """
+        Create a DiffHunk from a list of lines.
         
+        left_count and right_count are the lines of each file the hunk
+        covers, tallied by the caller while it collected the lines.
+        """
         return DiffHunk(
             left_start=start_left + 1,  # 1-indexed
             left_count=left_count,
@@ -804,42 +933,31 @@ class TextDiffEngine:
             lines=lines
         )
     
-    def _calculate_statistics(
-        self,
-        lines: list[DiffLine],
-        total_left: int,
-        total_right: int
-    ) -> DiffStatistics:
-        """Calculate diff statistics from lines."""
-        stats = DiffStatistics(
-            total_lines_left=total_left,
-            total_lines_right=total_right
-        )
-        
-        for line in lines:
-            if line.line_type == DiffLineType.UNCHANGED:
-                stats.unchanged_lines += 1
-            elif line.line_type == DiffLineType.ADDED:
-                stats.added_lines += 1
-            elif line.line_type == DiffLineType.REMOVED:
-                stats.removed_lines += 1
-            elif line.line_type == DiffLineType.MODIFIED:
-                stats.modified_lines += 1
-        
-        # Adjust for double-counting of modified lines
-        stats.modified_lines //= 2
-        
-        return stats
-    
-    def _tokenize(self, text: str) -> list[str]:
+    @staticmethod
+    def _tokenize(text: str) -> list[str]:
         """Tokenize text into words and whitespace."""
-        tokens = []
-        pattern = re.compile(r'(\s+|\S+)')
-        
-        for match in pattern.finditer(text):
-            tokens.append(match.group())
-        
-        return tokens
+        return _TOKEN_RE.findall(text)
+
+
+# Length of a line-number gutter for numbers up to four digits; larger
+# numbers widen it
+_LINE_PREFIX_LEN = 6
+_MAX_PADDED_LINE_NUM = 9999
+
+
+@functools.lru_cache(maxsize=LINE_PREFIX_CACHE_SIZE)
+def _line_prefix(line_num: int) -> str:
+    """Line-number gutter for side-by-side output, e.g. '  42: '."""
+    return f"{line_num:4d}: "
+
+
+# Gutter between the two columns for each pair type; anything else,
+# such as a modified pair, is shown as " | "
+_SIDE_BY_SIDE_SEPARATORS = {
+    DiffLineType.UNCHANGED: "   ",
+    DiffLineType.ADDED: " > ",
+    DiffLineType.REMOVED: " < ",
+}
 
 
 class SideBySideFormatter:
@@ -848,6 +966,8 @@ class SideBySideFormatter:
     def __init__(self, width: int = 80, tab_size: int = 4):
         self.width = width
         self.tab_size = tab_size
+        self._formatter: Optional[Callable[[DiffLine], str]] = None
+        self._formatter_key: Optional[tuple[int, int]] = None
     
     def format(self, result: DiffResult) -> Iterator[tuple[str, str, str]]:
         """
@@ -855,31 +975,128 @@ class SideBySideFormatter:
         
         Yields tuples of (left_line, separator, right_line)
         """
+        format_line = self._line_formatter()
+        separator = _SIDE_BY_SIDE_SEPARATORS.get
+        
         for pair in result.line_pairs:
-            left = self._format_line(pair.left_line) if pair.left_line else ""
-            right = self._format_line(pair.right_line) if pair.right_line else ""
+            left_line = pair.left_line
+            right_line = pair.right_line
+            left = format_line(left_line) if left_line else ""
             
-            if pair.pair_type == DiffLineType.UNCHANGED:
-                sep = "   "
-            elif pair.pair_type == DiffLineType.ADDED:
-                sep = " > "
-            elif pair.pair_type == DiffLineType.REMOVED:
-                sep = " < "
+            # Unchanged pairs share one DiffLine, so its text is reused
+            if right_line is left_line:
+                right = left
             else:
-                sep = " | "
+                right = format_line(right_line) if right_line else ""
             
-            yield (left, sep, right)
+            yield (left, separator(pair.pair_type, " | "), right)
     
-    def _format_line(self, line: DiffLine) -> str:
-        """Format a single line with line number."""
-        content = line.content.rstrip('\r\n')
-        content = content.replace('\t', ' ' * self.tab_size)
+    def format_columns(
+        self,
+        result: DiffResult
+    ) -> tuple[list[str], list[str], list[str]]:
+        """
+        Format diff for side-by-side display as three parallel columns.
+        
+        Returns:
+            (left_lines, separators, right_lines), one entry per line pair
+        """
+        format_line = self._line_formatter()
+        separator = _SIDE_BY_SIDE_SEPARATORS.get
+        
+        lefts: list[str] = []
+        seps: list[str] = []
+        rights: list[str] = []
+        add_left = lefts.append
+        add_sep = seps.append
+        add_right = rights.append
+        
+        for pair in result.line_pairs:
+            left_line = pair.left_line
+            right_line = pair.right_line
+            left = format_line(left_line) if left_line else ""
+            add_left(left)
+            
+            # Unchanged pairs share one DiffLine, so its text is reused
+            if right_line is left_line:
+                add_right(left)
+            else:
+                add_right(format_line(right_line) if right_line else "")
+            
+            add_sep(separator(pair.pair_type, " | "))
+        
+        return lefts, seps, rights
+    
+    def format_lines(self, lines: Iterable[DiffLine]) -> str:
+        """
+        Format lines with line numbers as one newline-separated block.
+        
+        Uses one formatter for the whole batch and a single join instead
+        of concatenating the output line by line.
+        """
+        # numpy.char is not used here: its functions loop over the
+        # elements in Python, and copying into fixed-width unicode arrays
+        # made batch formatting several times slower than this
+        return '\n'.join(map(self._line_formatter(), lines))
+    
+    def render_to(self, lines: Iterable[DiffLine], out: TextIO) -> None:
+        """
+        Write lines with line numbers to a text stream, one per line.
         
-        line_num = line.left_line_num or line.right_line_num or 0
-        prefix = f"{line_num:4d}: "
+        Unlike format_lines, the output is never held in memory as a
+        whole, so peak memory stays at one formatted line.
         
-        max_content = self.width - len(prefix)
-        if len(content) > max_content:
-            content = content[:max_content - 3] + "..."
+        Args:
+            lines: Lines to format
+            out: Writable text stream, e.g. an open file or io.StringIO
+        """
+        format_line = self._line_formatter()
+        write = out.write
+        
+        for line in lines:
+            write(format_line(line))
+            write('\n')
+    
+    def _format_line(self, line: DiffLine) -> str:
+        """Format a single line with line number."""
+        return self._line_formatter()(line)
+    
+    def _line_formatter(self) -> Callable[[DiffLine], str]:
+        """
+        Get a line formatter specialized for the current width and tab size.
+        
+        The formatter is rebuilt only when width or tab_size has changed,
+        so single-line calls reuse it as well. The tab replacement is built
+        once per formatter instead of for every line.
+        Each step is a single C-level str method, so the remaining cost is
+        interpreter dispatch; there is no compiled variant because the
+        PyInstaller build has no C extension step.
+        """
+        key = (self.width, self.tab_size)
+        if self._formatter is not None and self._formatter_key == key:
+            return self._formatter
+        
+        width, tab_size = key
+        tab = ' ' * tab_size
+        max_content = width - _LINE_PREFIX_LEN
+        
+        def format_line(line: DiffLine) -> str:
+            # rstrip and replace return the same object when there is
+            # nothing to change; a translate table was ~25x slower here
+            content = line.content.rstrip('\r\n')
+            content = content.replace('\t', tab)
+            
+            line_num = line.left_line_num or line.right_line_num or 0
+            prefix = _line_prefix(line_num)
+            
+            limit = max_content
+            if line_num > _MAX_PADDED_LINE_NUM:
+                limit = width - len(prefix)
+            if len(content) > limit:
+                content = content[:limit - 3] + "..."
+            
+            return prefix + content
         
-        return prefix + content
\ No newline at end of file
+        self._formatter = format_line
+        self._formatter_key = key
+        return format_line
@@ -8,20 +8,37 @@ Provides functionality for:
 - Synchronization planning
 """
 
-from app.core.folder.scanner import (
-    FolderScanner,
-    ScanOptions,
-    ScanResult,
-    PatternMatcher,
-)
-from app.core.folder.comparer import (
-    FolderComparer,
-    CompareOptions as FolderCompareOptions,
-)
-from app.core.folder.sync import (
-    FolderSync,
-    SyncOptions,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.core.folder.scanner import (
+        FolderScanner,
+        ScanOptions,
+        ScanResult,
+        PatternMatcher,
+    )
+    from app.core.folder.comparer import (
+        FolderComparer,
+        CompareOptions as FolderCompareOptions,
+    )
+    from app.core.folder.sync import (
+        FolderSync,
+        SyncOptions,
+    )
+
+# Public name -> (submodule, attribute); submodules are imported on first
+# access so importing the package does not pull in all three of them
+_LAZY = {
+    'FolderScanner': ('app.core.folder.scanner', 'FolderScanner'),
+    'ScanOptions': ('app.core.folder.scanner', 'ScanOptions'),
+    'ScanResult': ('app.core.folder.scanner', 'ScanResult'),
+    'PatternMatcher': ('app.core.folder.scanner', 'PatternMatcher'),
+    'FolderComparer': ('app.core.folder.comparer', 'FolderComparer'),
+    'FolderCompareOptions': ('app.core.folder.comparer', 'CompareOptions'),
+    'FolderSync': ('app.core.folder.sync', 'FolderSync'),
+    'SyncOptions': ('app.core.folder.sync', 'SyncOptions'),
+}
 
 __all__ = [
     # Scanner
@@ -35,4 +52,23 @@ __all__ = [
     # Sync
     'FolderSync',
     'SyncOptions',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names without importing their submodules."""
+    return sorted({*globals(), *__all__})
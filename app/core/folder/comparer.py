@@ -11,8 +11,11 @@ Compares two directory trees and identifies:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,7 +33,167 @@ from app.core.models import (
     FolderCompareProgress,
     CompareMethod,
 )
-from app.core.folder.scanner import FolderScanner, ScanOptions, ScanResult
+from app.core.folder.scanner import FolderScanner, ScanOptions, ScanProgress, ScanResult
+
+# C line matching - cdifflib
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+    CDIFFLIB_AVAILABLE = True
+except ImportError:
+    from difflib import SequenceMatcher
+    CDIFFLIB_AVAILABLE = False
+
+# Fast non-cryptographic hashing - xxHash
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Bytes read from the start, middle and end of equal-sized files before a
+# full comparison; most modified files already differ in one of these
+PROBE_SIZE = 4096
+
+# Most file pairs handed to a worker in one task; fewer, larger tasks cut
+# executor and future overhead on trees of many small files
+COMPARE_BATCH_SIZE = 64
+
+# Most file bytes in one task; large files get a task of their own so a
+# batch of them cannot leave one worker busy while the others sit idle
+COMPARE_BATCH_BYTES = 8 * 1024 * 1024
+
+# Progress callbacks are coalesced: a phase reports again only after this
+# many more items or this many seconds, and always on its first and last
+# update (scan phases have no total, so their end is reported explicitly)
+PROGRESS_INTERVAL_ITEMS = 256
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# Statistics counter bumped for each file status; other statuses are only
+# counted in the file/directory totals
+_STATUS_STATISTICS = {
+    FileStatus.IDENTICAL: 'identical',
+    FileStatus.MODIFIED: 'modified',
+    FileStatus.LEFT_ONLY: 'left_only',
+    FileStatus.RIGHT_ONLY: 'right_only',
+    FileStatus.ERROR: 'errors',
+}
+
+# Flags for hashing reads; O_BINARY keeps Windows from translating line
+# endings, O_NOATIME (Linux) avoids an inode write per file read
+_HASH_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Smallest read buffer for hashing, so a file that grew after it was
+# scanned is still read in page-sized pieces
+MIN_HASH_BUFFER_SIZE = 4096
+
+# File digests kept between comparisons; a file whose size and mtime are
+# unchanged since it was last hashed is not read again
+HASH_CACHE_SIZE = 1 << 16
+
+
+def _new_hasher(algorithm: str):
+    """
+    Create a hash object by algorithm name.
+    
+    xxHash names ('xxh3_128', 'xxh64', ...) use the xxhash package and fall
+    back to SHA-256 when it is not installed; digests are only compared
+    within one run, so both sides always use the same algorithm.
+    """
+    if algorithm.startswith('xxh'):
+        if XXHASH_AVAILABLE:
+            return getattr(xxhash, algorithm)()
+        return hashlib.sha256()
+    return hashlib.new(algorithm)
+
+
+def _open_for_hashing(path: Path) -> int:
+    """
+    Open a file for a single sequential read and return its descriptor.
+    
+    Skips the access-time update where supported (O_NOATIME only works on
+    files the user owns, so it is dropped on EPERM) and asks the kernel for
+    sequential read-ahead.
+    """
+    try:
+        fd = os.open(path, _HASH_OPEN_FLAGS | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(path, _HASH_OPEN_FLAGS)
+    
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return fd
+
+
+def _hash_file(
+    path: Path,
+    algorithm: str,
+    chunk_size: int,
+    size: Optional[int] = None
+) -> str:
+    """
+    Hash a file's contents with the named algorithm.
+    
+    Reads into one reused buffer, sized down to the file when its size is
+    known to be smaller than a chunk. The scan-time size may be stale, so
+    the buffer never drops below MIN_HASH_BUFFER_SIZE.
+    """
+    hasher = _new_hasher(algorithm)
+    if size is not None:
+        chunk_size = min(chunk_size, max(MIN_HASH_BUFFER_SIZE, size))
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    
+    with open(_open_for_hashing(path), 'rb', buffering=0) as f:
+        while count := f.readinto(buffer):
+            hasher.update(view[:count])
+    
+    return hasher.hexdigest()
+
+
+# (path, algorithm, size, mtime) -> digest, least recently used first
+_digest_cache: OrderedDict[tuple, str] = OrderedDict()
+_digest_cache_lock = threading.Lock()
+
+
+def _digest_cache_key(
+    path: Path,
+    algorithm: str,
+    meta: Optional[FileMetadata]
+) -> Optional[tuple]:
+    """
+    Cache key for a file's digest, or None if it cannot be cached.
+    
+    The key is (path, algorithm, size, mtime). Size and mtime make an
+    edited file miss the cache and be read again; the hash chunk size
+    is left out because it does not change the digest.
+    """
+    if meta is None or meta.modified_time is None:
+        return None
+    return (path, algorithm, meta.size, meta.modified_time)
+
+
+def _cached_digest(key: tuple) -> Optional[str]:
+    """Look up a digest kept from an earlier hash of the same file."""
+    with _digest_cache_lock:
+        digest = _digest_cache.get(key)
+        if digest is not None:
+            _digest_cache.move_to_end(key)
+        return digest
+
+
+def _store_digest(key: tuple, digest: str) -> None:
+    """Keep a digest, evicting the least recently used past HASH_CACHE_SIZE."""
+    with _digest_cache_lock:
+        _digest_cache[key] = digest
+        _digest_cache.move_to_end(key)
+        if len(_digest_cache) > HASH_CACHE_SIZE:
+            _digest_cache.popitem(last=False)
 
 
 @dataclass
@@ -39,7 +202,7 @@ class CompareOptions:
     # Comparison method
     compare_contents: bool = True
     use_hash: bool = True
-    hash_algorithm: str = 'sha256'
+    hash_algorithm: str = 'xxh3_128'  # Equality only, not security
     quick_compare: bool = True  # Use size + mtime before content
     
     # Content comparison options
@@ -85,13 +248,15 @@ class FolderComparer:
     Uses configurable comparison strategies:
     - Quick compare: size + modification time
     - Content compare: byte-by-byte
-    - Hash compare: SHA-256 or other hash
+    - Hash compare: xxHash, SHA-256 or other hash
     """
     
     def __init__(self, options: Optional[CompareOptions] = None):
         self.options = options or CompareOptions()
         self._cancelled = False
         self._progress_callback: Optional[Callable[[CompareProgress], None]] = None
+        # phase -> (items, monotonic time) of the last progress report sent
+        self._last_progress: dict[str, tuple[int, float]] = {}
     
     def compare(
         self,
@@ -117,6 +282,7 @@ class FolderComparer:
         
         self._cancelled = False
         self._progress_callback = progress_callback
+        self._last_progress = {}
         
         # Validate paths
         if not left_path.exists():
@@ -148,12 +314,12 @@ class FolderComparer:
             left_future = executor.submit(
                 scanner.scan,
                 left_path,
-                lambda p: self._report_progress('scanning_left', p.current_path, p.files_found, 0, 0)
+                functools.partial(self._report_scan_progress, 'scanning_left')
             )
             right_future = executor.submit(
                 scanner.scan,
                 right_path,
-                lambda p: self._report_progress('scanning_right', p.current_path, p.files_found, 0, 0)
+                functools.partial(self._report_scan_progress, 'scanning_right')
             )
 
             self._report_progress('scanning_left', '', 0, 0, 0) # Initial progress report
@@ -162,6 +328,10 @@ class FolderComparer:
             left_scan = left_future.result()
             right_scan = right_future.result()
         
+        # Final scan counts; throttling may have held back the last updates
+        self._report_progress('scanning_left', '', left_scan.file_count, 0, 0, force=True)
+        self._report_progress('scanning_right', '', right_scan.file_count, 0, 0, force=True)
+        
         if self._cancelled:
             logging.info("FolderComparer - Comparison cancelled during left scan.")
             return self._create_cancelled_result(left_path, right_path, error_message="Comparison cancelled during left scan.")
@@ -215,25 +385,30 @@ class FolderComparer:
         right_paths = right_scan.get_all_paths()
         
         # Determine how to match paths
+        # No ordering is needed here; the result tree sorts its own entries
         if self.options.ignore_case:
-            # Map lowercase paths to original casing (preferring left)
-            left_map = {p.lower(): p for p in left_paths}
-            right_map = {p.lower(): p for p in right_paths}
+            # Map lowercase paths to original casing, [left, right]
+            matched: dict[str, list[Optional[str]]] = {}
+            for p in left_paths:
+                matched[p.lower()] = [p, None]
+            for p in right_paths:
+                pair = matched.get(p.lower())
+                if pair is None:
+                    matched[p.lower()] = [None, p]
+                else:
+                    pair[1] = p
             
-            all_lower = sorted(set(left_map.keys()) | set(right_map.keys()))
-            comparison_paths = []
-            for lower in all_lower:
-                l_orig = left_map.get(lower)
-                r_orig = right_map.get(lower)
-                # Use left path as the canonical relative path if it exists
-                canonical = l_orig if l_orig is not None else r_orig
-                comparison_paths.append((canonical, l_orig, r_orig))
+            # Use left path as the canonical relative path if it exists
+            comparison_paths = [
+                (l_orig if l_orig is not None else r_orig, l_orig, r_orig)
+                for l_orig, r_orig in matched.values()
+            ]
         else:
-            all_paths = sorted(left_paths | right_paths)
-            comparison_paths = [(p, p, p) for p in all_paths]
+            comparison_paths = [(p, p, p) for p in left_paths | right_paths]
         
-        # Compare each path
+        # Compare each path; statistics are tallied as results are stored
         results: dict[str, FileCompareResult] = {}
+        stats = self._new_statistics()
         total_items = len(comparison_paths)
         processed = 0
         
@@ -292,6 +467,7 @@ class FolderComparer:
                 continue
             
             results[rel_path] = compare_result
+            self._tally_result(stats, compare_result)
             processed += 1
             self._report_progress('comparing', rel_path, processed, total_items, 
                                  processed / total_items * 100)
@@ -301,7 +477,8 @@ class FolderComparer:
             file_results = self._compare_files_parallel(
                 left_path, right_path,
                 file_comparisons,
-                processed, total_items
+                processed, total_items,
+                stats
             )
             results.update(file_results)
         
@@ -313,9 +490,6 @@ class FolderComparer:
             raise
 
         
-        # Calculate statistics
-        stats = self._calculate_statistics(results)
-        
         return FolderCompareResult(
             left_path=str(left_path),
             right_path=str(right_path),
@@ -335,52 +509,110 @@ class FolderComparer:
         right_root: Path,
         comparisons: list[tuple[str, FileMetadata, FileMetadata]],
         base_processed: int,
-        total_items: int
+        total_items: int,
+        stats: dict[str, int]
     ) -> dict[str, FileCompareResult]:
-        """Compare files using parallel workers."""
+        """
+        Compare files using parallel workers.
+        
+        File pairs are submitted in batches rather than one task per file;
+        batches stay small enough that every worker gets several of them.
+        Batches are also capped by size, so small files are grouped while
+        large ones are compared as separate tasks. Largest pairs are queued
+        first, so the run does not end waiting on one big file that was
+        picked up last. Each result is tallied into stats as it arrives.
+        """
         results: dict[str, FileCompareResult] = {}
         processed = base_processed
         
-        with ThreadPoolExecutor(max_workers=self.options.parallel_workers) as executor:
-            futures = {}
+        workers = max(1, self.options.parallel_workers)
+        batch_size = max(1, min(COMPARE_BATCH_SIZE, len(comparisons) // (workers * 4)))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            
+            # Longest-first ordering; the executor's shared queue then
+            # hands the remaining small batches to whichever worker is free
+            comparisons = sorted(
+                comparisons,
+                key=lambda item: item[1].size + item[2].size,
+                reverse=True
+            )
             
-            for rel_path, left_meta, right_meta in comparisons:
+            for batch in self._batch_comparisons(comparisons, batch_size):
                 if self._cancelled:
                     break
                 
-                future = executor.submit(
-                    self._compare_single_file,
-                    left_meta.path,
-                    right_meta.path,
-                    left_meta,
-                    right_meta,
-                    rel_path
-                )
-                futures[future] = rel_path
+                futures.append(executor.submit(self._compare_batch, batch))
             
             for future in as_completed(futures):
                 if self._cancelled:
-                    executor.shutdown(wait=False)
+                    executor.shutdown(wait=False, cancel_futures=True)
                     logging.info("FolderComparer - Parallel file comparison cancelled.")
                     break
                 
-                rel_path = futures[future]
-                try:
-                    result = future.result()
+                for rel_path, result in future.result():
                     results[rel_path] = result
-                except Exception as e:
-                    logging.error(f"FolderComparer - Error in parallel comparison for {rel_path}: {e}")
-                    results[rel_path] = FileCompareResult(
-                        relative_path=rel_path,
-                        left_metadata=None,
-                        right_metadata=None,
-                        status=FileStatus.ERROR,
-                        error=str(e)
-                    )
-                
-                processed += 1
-                self._report_progress('comparing', rel_path, processed, total_items,
-                                     processed / total_items * 100)
+                    self._tally_result(stats, result)
+                    processed += 1
+                    self._report_progress('comparing', rel_path, processed, total_items,
+                                         processed / total_items * 100)
+        return results
+    
+    @staticmethod
+    def _batch_comparisons(
+        comparisons: list[tuple[str, FileMetadata, FileMetadata]],
+        batch_size: int
+    ) -> Iterator[list[tuple[str, FileMetadata, FileMetadata]]]:
+        """Group file pairs by count and by COMPARE_BATCH_BYTES."""
+        batch: list[tuple[str, FileMetadata, FileMetadata]] = []
+        batch_bytes = 0
+        
+        for item in comparisons:
+            _, left_meta, right_meta = item
+            size = left_meta.size + right_meta.size
+            
+            if batch and (len(batch) >= batch_size or batch_bytes + size > COMPARE_BATCH_BYTES):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            
+            batch.append(item)
+            batch_bytes += size
+        
+        if batch:
+            yield batch
+    
+    def _compare_batch(
+        self,
+        comparisons: list[tuple[str, FileMetadata, FileMetadata]]
+    ) -> list[tuple[str, FileCompareResult]]:
+        """Compare a batch of file pairs in one worker task."""
+        results: list[tuple[str, FileCompareResult]] = []
+        
+        for rel_path, left_meta, right_meta in comparisons:
+            if self._cancelled:
+                break
+            
+            try:
+                result = self._compare_single_file(
+                    left_meta.path,
+                    right_meta.path,
+                    left_meta,
+                    right_meta,
+                    rel_path
+                )
+            except Exception as e:
+                logging.error(f"FolderComparer - Error in parallel comparison for {rel_path}: {e}")
+                result = FileCompareResult(
+                    relative_path=rel_path,
+                    left_metadata=None,
+                    right_metadata=None,
+                    status=FileStatus.ERROR,
+                    error=str(e)
+                )
+            results.append((rel_path, result))
+        
         return results
     
     def _compare_single_file(
@@ -444,11 +676,22 @@ class FolderComparer:
         
         # Content comparison
         if self.options.compare_contents:
-            if self.options.use_hash:
-                compare_method = CompareMethod.HASH
-                is_identical = self._compare_by_hash(left_path, right_path)
+            compare_method = CompareMethod.HASH if self.options.use_hash else CompareMethod.CONTENT
+            
+            # In hash mode the probe is skipped when both digests are cached,
+            # since the hash comparison then reads nothing
+            probe = left_meta.size == right_meta.size and not (
+                self.options.use_hash
+                and self._has_cached_digests(left_path, right_path, left_meta, right_meta)
+            )
+            
+            if probe and self._quick_content_probe(left_path, right_path, left_meta.size) is False:
+                is_identical = False
+            elif self.options.use_hash:
+                is_identical = self._compare_by_hash(
+                    left_path, right_path, left_meta, right_meta
+                )
             else:
-                compare_method = CompareMethod.CONTENT
                 is_identical = self._compare_by_content(left_path, right_path)
             
             status = FileStatus.IDENTICAL if is_identical else FileStatus.MODIFIED
@@ -502,9 +745,8 @@ class FolderComparer:
             res2 = io_service.read_file(right_path)
             
             if res1.success and res2.success and res1.content and res2.content:
-                import difflib
-                # Use faster similarity calculation if possible, but ratio() is standard
-                matcher = difflib.SequenceMatcher(None, res1.content.lines, res2.content.lines)
+                # cdifflib, when installed, gives the same ratio from C
+                matcher = SequenceMatcher(None, res1.content.lines, res2.content.lines)
                 return matcher.ratio()
             
             return 0.0
@@ -512,43 +754,122 @@ class FolderComparer:
             logging.debug(f"FolderComparer - Failed to calculate similarity for {left_path}: {e}")
             return 0.0
     
+    def _quick_content_probe(
+        self,
+        left_path: Path,
+        right_path: Path,
+        size: int
+    ) -> Optional[bool]:
+        """
+        Compare the start, middle and end of two equal-sized files.
+        
+        Returns:
+            False if a probed window differs, None if the probe is
+            inconclusive (all windows match or the files are too small
+            for probing to save anything over a full comparison)
+        """
+        if size <= 3 * PROBE_SIZE:
+            return None
+        
+        offsets = (0, (size - PROBE_SIZE) // 2, size - PROBE_SIZE)
+        try:
+            with open(left_path, 'rb') as f1, open(right_path, 'rb') as f2:
+                for offset in offsets:
+                    f1.seek(offset)
+                    f2.seek(offset)
+                    if f1.read(PROBE_SIZE) != f2.read(PROBE_SIZE):
+                        return False
+            return None
+        except Exception as e:
+            logging.error(f"FolderComparer - Error probing content for {left_path} and {right_path}: {e}")
+            raise
+    
     def _compare_by_content(self, left_path: Path, right_path: Path) -> bool:
-        """Compare files byte-by-byte."""
+        """
+        Compare files byte-by-byte.
+        
+        Both files are read into two reused buffers, so a long comparison
+        does not allocate a new bytes object per chunk.
+        """
+        chunk_size = self.options.chunk_size
+        buffer1 = bytearray(chunk_size)
+        buffer2 = bytearray(chunk_size)
+        
         try:
             with open(left_path, 'rb') as f1, open(right_path, 'rb') as f2:
                 while True:
-                    chunk1 = f1.read(self.options.chunk_size)
-                    chunk2 = f2.read(self.options.chunk_size)
+                    # Buffered readinto only returns a short count at EOF
+                    count1 = f1.readinto(buffer1)
+                    count2 = f2.readinto(buffer2)
                     
-                    if chunk1 != chunk2:
+                    if count1 != count2:
                         return False
                     
-                    if not chunk1:  # EOF
-                        return True
+                    if count1 < chunk_size:  # EOF
+                        return buffer1[:count1] == buffer2[:count2]
+                    
+                    if buffer1 != buffer2:
+                        return False
         except Exception as e:
             logging.error(f"FolderComparer - Error comparing content for {left_path} and {right_path}: {e}")
             raise
     
-    def _compare_by_hash(self, left_path: Path, right_path: Path) -> bool:
+    def _compare_by_hash(
+        self,
+        left_path: Path,
+        right_path: Path,
+        left_meta: Optional[FileMetadata] = None,
+        right_meta: Optional[FileMetadata] = None
+    ) -> bool:
         """Compare files by hash."""
         try:
-            left_hash = self._compute_hash(left_path)
-            right_hash = self._compute_hash(right_path)
+            left_hash = self._compute_hash(left_path, left_meta)
+            right_hash = self._compute_hash(right_path, right_meta)
             return left_hash == right_hash
         except Exception as e:
             logging.error(f"FolderComparer - Error comparing hash for {left_path} and {right_path}: {e}")
             raise
     
-    def _compute_hash(self, path: Path) -> str:
-        """Compute hash of a file."""
+    def _has_cached_digests(
+        self,
+        left_path: Path,
+        right_path: Path,
+        left_meta: FileMetadata,
+        right_meta: FileMetadata
+    ) -> bool:
+        """Check whether both digests can be answered without reading."""
+        algorithm = self.options.hash_algorithm
+        for path, meta in ((left_path, left_meta), (right_path, right_meta)):
+            key = _digest_cache_key(path, algorithm, meta)
+            if key is None or _cached_digest(key) is None:
+                return False
+        return True
+    
+    def _compute_hash(self, path: Path, meta: Optional[FileMetadata] = None) -> str:
+        """
+        Compute hash of a file.
+        
+        When the scan metadata carries a modification time, the digest is
+        looked up by (path, size, mtime) first so unchanged files are only
+        read once across repeated comparisons.
+        """
         try:
-            hasher = hashlib.new(self.options.hash_algorithm)
-            
-            with open(path, 'rb') as f:
-                while chunk := f.read(self.options.chunk_size):
-                    hasher.update(chunk)
+            algorithm = self.options.hash_algorithm
+            key = _digest_cache_key(path, algorithm, meta)
+            if key is not None:
+                digest = _cached_digest(key)
+                if digest is not None:
+                    return digest
             
-            return hasher.hexdigest()
+            digest = _hash_file(
+                path,
+                algorithm,
+                self.options.chunk_size,
+                meta.size if meta is not None else None
+            )
+            if key is not None:
+                _store_digest(key, digest)
+            return digest
         except Exception as e:
             logging.error(f"FolderComparer - Error computing hash for {path}: {e}")
             raise
@@ -571,20 +892,20 @@ class FolderComparer:
         # Map to track created nodes
         nodes: dict[str, FolderCompareNode] = {"": root}
         
+        # Relative paths come from str(Path), so splitting on os.sep finds
+        # the parent without building Path objects
+        sep = os.sep
+        
         # Sort paths to ensure parents are created before children
-        for rel_path in sorted(results.keys()):
+        for rel_path in sorted(results):
             result = results[rel_path]
             
             # Find or create parent
-            parent_path = str(Path(rel_path).parent)
-            if parent_path == ".":
-                parent_path = ""
-            
-            if parent_path not in nodes:
+            parent_path = rel_path.rpartition(sep)[0]
+            parent_node = nodes.get(parent_path)
+            if parent_node is None:
                 # Create intermediate directory nodes
-                self._ensure_parent_nodes(nodes, parent_path, root)
-            
-            parent_node = nodes[parent_path]
+                parent_node = self._ensure_parent_nodes(nodes, parent_path, root)
             
             # Create this node
             node = FolderCompareNode(result=result, parent=parent_node)
@@ -600,14 +921,13 @@ class FolderComparer:
         nodes: dict[str, FolderCompareNode],
         path: str,
         root: FolderCompareNode
-    ) -> None:
-        """Ensure all parent nodes exist."""
-        parts = Path(path).parts
+    ) -> FolderCompareNode:
+        """Ensure all parent nodes exist and return the node for path."""
         current_path = ""
         current_node = root
         
-        for part in parts:
-            current_path = str(Path(current_path) / part) if current_path else part
+        for part in path.split(os.sep):
+            current_path = f"{current_path}{os.sep}{part}" if current_path else part
             
             if current_path not in nodes:
                 # Create directory node
@@ -631,23 +951,34 @@ class FolderComparer:
                 current_node = node
             else:
                 current_node = nodes[current_path]
+        
+        return current_node
     
     def _sort_tree(self, node: FolderCompareNode) -> None:
-        """Recursively sort tree children."""
-        node.children.sort(key=lambda n: (
-            0 if n.is_directory else 1,
-            n.name.lower()
-        ))
+        """
+        Sort tree children, directories first, then by name.
         
-        for child in node.children:
-            self._sort_tree(child)
+        The key takes the name straight from the relative path; going
+        through FolderCompareNode.name would build a Path per node.
+        """
+        sep = os.sep
+        
+        def sort_key(child: FolderCompareNode) -> tuple[int, str]:
+            result = child.result
+            name = result.relative_path.rpartition(sep)[2]
+            return (0 if result.is_directory else 1, name.lower())
+        
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            if current.children:
+                current.children.sort(key=sort_key)
+                pending.extend(current.children)
     
-    def _calculate_statistics(
-        self,
-        results: dict[str, FileCompareResult]
-    ) -> dict[str, int]:
-        """Calculate comparison statistics."""
-        stats = {
+    @staticmethod
+    def _new_statistics() -> dict[str, int]:
+        """Create zeroed comparison statistics."""
+        return {
             'total_files': 0,
             'total_dirs': 0,
             'identical': 0,
@@ -656,24 +987,18 @@ class FolderComparer:
             'right_only': 0,
             'errors': 0,
         }
+    
+    @staticmethod
+    def _tally_result(stats: dict[str, int], result: FileCompareResult) -> None:
+        """Add one comparison result to the statistics."""
+        if result.is_directory:
+            stats['total_dirs'] += 1
+        else:
+            stats['total_files'] += 1
         
-        for result in results.values():
-            if result.is_directory:
-                stats['total_dirs'] += 1
-            else:
-                stats['total_files'] += 1
-            
-            if result.status == FileStatus.IDENTICAL:
-                stats['identical'] += 1
-            elif result.status == FileStatus.MODIFIED:
-                stats['modified'] += 1
-            elif result.status == FileStatus.LEFT_ONLY:
-                stats['left_only'] += 1
-            elif result.status == FileStatus.RIGHT_ONLY:
-                stats['right_only'] += 1
-            elif result.status == FileStatus.ERROR:
-                stats['errors'] += 1
-        return stats
+        key = _STATUS_STATISTICS.get(result.status)
+        if key is not None:
+            stats[key] += 1
     
     def _report_progress(
         self,
@@ -681,10 +1006,27 @@ class FolderComparer:
         current_path: str,
         processed: int,
         total: int,
-        percent: float
+        percent: float,
+        force: bool = False
     ) -> None:
-        """Report progress to callback."""
+        """
+        Report progress to callback.
+        
+        Updates are throttled per phase (see PROGRESS_INTERVAL_ITEMS), so
+        large trees do not make one cross-thread GUI callback per entry.
+        The first update of a phase, its last item and forced updates are
+        always sent; force is for phase ends without a known total.
+        """
         if self._progress_callback:
+            now = time.monotonic()
+            last = self._last_progress.get(phase)
+            is_final = force or (total > 0 and processed >= total)
+            if (last is not None and not is_final
+                    and processed - last[0] < PROGRESS_INTERVAL_ITEMS
+                    and now - last[1] < PROGRESS_INTERVAL_SECONDS):
+                return
+            self._last_progress[phase] = (processed, now)
+            
             progress = CompareProgress(
                 phase=phase,
                 current_path=current_path,
@@ -694,6 +1036,10 @@ class FolderComparer:
             )
             self._progress_callback(progress)
     
+    def _report_scan_progress(self, phase: str, progress: ScanProgress) -> None:
+        """Forward scanner progress for one side as comparison progress."""
+        self._report_progress(phase, progress.current_path, progress.files_found, 0, 0)
+    
     def _create_cancelled_result(
         self,
         left_path: Path,
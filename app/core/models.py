@@ -145,7 +145,18 @@ class IntralineDiff:
         return self.end - self.start
 
 
-@dataclass
+# Unified-diff prefix character for each line type
+_LINE_PREFIXES = {
+    DiffLineType.UNCHANGED: ' ',
+    DiffLineType.ADDED: '+',
+    DiffLineType.REMOVED: '-',
+    DiffLineType.MODIFIED: '!',
+    DiffLineType.CONTEXT: ' ',
+    DiffLineType.EMPTY: ' ',
+}
+
+
+@dataclass(slots=True)
 class DiffLine:
     """
     A single line in a diff result.
@@ -177,18 +188,10 @@ class DiffLine:
     @property
     def prefix(self) -> str:
         """Get the diff prefix character."""
-        prefixes = {
-            DiffLineType.UNCHANGED: ' ',
-            DiffLineType.ADDED: '+',
-            DiffLineType.REMOVED: '-',
-            DiffLineType.MODIFIED: '!',
-            DiffLineType.CONTEXT: ' ',
-            DiffLineType.EMPTY: ' ',
-        }
-        return prefixes.get(self.line_type, ' ')
+        return _LINE_PREFIXES.get(self.line_type, ' ')
 
 
-@dataclass
+@dataclass(slots=True)
 class LinePair:
     """
     A pair of lines for side-by-side display.
@@ -343,6 +346,10 @@ class DiffResult:
 # Binary Diff Models
 # =============================================================================
 
+# Two-digit uppercase hex for every byte value, for per-byte formatting
+_HEX_PAIRS = tuple(f"{i:02X}" for i in range(256))
+
+
 @dataclass(frozen=True)
 class ByteDifference:
     """Represents a single byte difference between files."""
@@ -366,8 +373,8 @@ class ByteDifference:
         return self.left_byte is not None and self.right_byte is not None
     
     def __str__(self) -> str:
-        left = f"{self.left_byte:02X}" if self.left_byte is not None else "--"
-        right = f"{self.right_byte:02X}" if self.right_byte is not None else "--"
+        left = _HEX_PAIRS[self.left_byte] if self.left_byte is not None else "--"
+        right = _HEX_PAIRS[self.right_byte] if self.right_byte is not None else "--"
         return f"0x{self.offset:08X}: {left} -> {right}"
 
 
@@ -402,7 +409,7 @@ class BinaryDiffResult:
     left_size: int
     right_size: int
     is_identical: bool
-    differences: list[ByteDifference]
+    differences: Sequence[ByteDifference]
     chunks: list[BinaryDiffChunk]
     total_differences: int
     truncated: bool = False          # True if stopped before finding all differences
@@ -497,7 +504,7 @@ class ImageDiffResult:
     right_image: Any                     # Original processed right image
     difference_image: Any                # PIL.Image of differences
     visualization_image: Any             # PIL.Image visualization
-    regions: list[ImageDiffRegion]       # Regions of difference
+    regions: Sequence[ImageDiffRegion]   # Regions of difference
     size_match: bool
     different_pixel_count: int = 0
     error: Optional[str] = None
@@ -650,7 +650,6 @@ class FileCompareView(QWidget):
                 display_content=line_pair.left_line.content
             )
             line_pair.pair_type = DiffLineType.UNCHANGED
-            line_pair.intraline_diff = None # Clear intraline diff after copy
             self._modified = True
             self.modified_changed.emit(True)
             self.set_diff_result(self._diff_result) # Refresh view
@@ -677,7 +676,6 @@ class FileCompareView(QWidget):
                 display_content=line_pair.right_line.content
             )
             line_pair.pair_type = DiffLineType.UNCHANGED
-            line_pair.intraline_diff = None # Clear intraline diff after copy
             self._modified = True
             self.modified_changed.emit(True)
             self.set_diff_result(self._diff_result) # Refresh view
@@ -704,7 +702,6 @@ class FileCompareView(QWidget):
                      pair.right_line = None
                 
                 pair.pair_type = DiffLineType.UNCHANGED
-                pair.intraline_diff = None
                 any_changed = True
         
         if any_changed:
@@ -733,7 +730,6 @@ class FileCompareView(QWidget):
                      pair.left_line = None
                 
                 pair.pair_type = DiffLineType.UNCHANGED
-                pair.intraline_diff = None
                 any_changed = True
         
         if any_changed: